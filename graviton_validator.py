@@ -174,6 +174,12 @@ For detailed documentation, see README.md
         action='store_true',
         help='Use Docker for isolated runtime testing (recommended for --test)'
     )
+    analysis_group.add_argument(
+        '--keep-images',
+        dest='keep_images',
+        action='store_true',
+        help='Keep built toolchain images after the run so later --containers runs skip the build'
+    )
     analysis_group.add_argument(
         '--jars',
         dest='jar_files',
@@ -442,6 +448,9 @@ def validate_arguments(args: argparse.Namespace) -> None:
             print("Warning: --runtime is implicit in --runtime-only mode", file=sys.stderr)
         # --test and --containers are still relevant for runtime-only mode
     
+    if args.keep_images and not args.use_containers:
+        print("Warning: --keep-images only applies with --containers", file=sys.stderr)
+    
     # Auto-enable dependent options for regular mode
     if not args.sbom_only and not args.runtime_only:
         if args.runtime_test and not args.runtime_analysis:
@@ -1070,7 +1079,8 @@ def main() -> int:
             
             runtime_analyzer_manager = RuntimeAnalyzerManager(
                 config_file=args.runtime_config_file,
-                use_containers=use_containers
+                use_containers=use_containers,
+                keep_images=args.keep_images
             )
             
             if args.runtime_config_file:
@@ -4,6 +4,7 @@ Cache Manager for Runtime Analyzers
 Provides persistent caching, batch processing, and rate limiting for API calls.
 """
 
+import asyncio
 import json
 import time
 import hashlib
@@ -214,10 +215,8 @@ class CacheManager:
                 state.backoff_until = time.time() + backoff_seconds
                 logger.warning(f"API failure for {runtime}, backing off for {backoff_seconds:.1f}s")
     
-    def wait_for_rate_limit(self, runtime: str) -> float:
-        """Wait for rate limit to allow request. Returns wait time."""
-        total_wait = 0
-        
+    def _rate_limit_delay(self, runtime: str) -> float:
+        """Seconds to wait before the next request may be made; never sleeps, so the lock is held briefly."""
         with self.lock:
             if runtime not in self.rate_limits:
                 self.rate_limits[runtime] = RateLimitState()
@@ -229,9 +228,7 @@ class CacheManager:
             if now < state.backoff_until:
                 backoff_wait = state.backoff_until - now
                 logger.info(f"Waiting {backoff_wait:.1f}s for {runtime} exponential backoff")
-                time.sleep(backoff_wait)
-                total_wait += backoff_wait
-                now = time.time()
+                return backoff_wait
             
             # Check if we need to wait for rate limit window
             if runtime in self.rate_config:
@@ -247,11 +244,32 @@ class CacheManager:
                     window_wait = 60 - (now - state.window_start)
                     if window_wait > 0:
                         logger.info(f"Waiting {window_wait:.1f}s for {runtime} rate limit window reset")
-                        time.sleep(window_wait)
-                        total_wait += window_wait
-                        # Reset the window after waiting
-                        state.requests_made = 0
-                        state.window_start = time.time()
+                        return window_wait
+        
+        return 0
+    
+    def wait_for_rate_limit(self, runtime: str) -> float:
+        """Wait for rate limit to allow request. Returns wait time."""
+        total_wait = 0
+        
+        # Sleep outside the lock so other threads can still read the cache and record requests
+        delay = self._rate_limit_delay(runtime)
+        while delay > 0:
+            time.sleep(delay)
+            total_wait += delay
+            delay = self._rate_limit_delay(runtime)
+        
+        return total_wait
+    
+    async def wait_for_rate_limit_async(self, runtime: str) -> float:
+        """Async counterpart of wait_for_rate_limit that yields to the event loop while waiting."""
+        total_wait = 0
+        
+        delay = self._rate_limit_delay(runtime)
+        while delay > 0:
+            await asyncio.sleep(delay)
+            total_wait += delay
+            delay = self._rate_limit_delay(runtime)
         
         return total_wait
     
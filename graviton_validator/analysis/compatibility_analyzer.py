@@ -445,14 +445,7 @@ class GravitonCompatibilityAnalyzer(CompatibilityAnalyzer):
         categorized = {}
         
         for component in components:
-            component_dict = {
-                "name": component.name,
-                "version": component.version,
-                "type": component.component_type,
-                "properties": component.properties
-            }
-            
-            category = self.component_filter.categorize_component(component_dict, detected_os)
+            category = self.component_filter.categorize_software_component(component, detected_os)
             categorized[component.name] = category
             
             logger.debug(f"Categorized {component.name} as {category.value}")
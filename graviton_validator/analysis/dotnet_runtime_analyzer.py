@@ -5,10 +5,19 @@ Analyzes .NET packages for Graviton compatibility using NuGet API metadata
 and hybrid analysis approach with configurable metadata lookup.
 """
 
+import asyncio
 import json
 import logging
+import operator
+import os
+import re
+import sys
 import requests
-from typing import Dict, List, Optional, Set
+import defusedxml.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 from urllib.parse import quote
 
 from .runtime_analyzer import RuntimeCompatibilityAnalyzer
@@ -16,8 +25,175 @@ from .cache_manager import get_cache_manager
 from ..models import SoftwareComponent, ComponentResult, CompatibilityResult, CompatibilityStatus
 from ..knowledge_base.runtime_loader import RuntimeKnowledgeBaseLoader
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Runtime identifier blocks in .nuspec manifests
+_RID_RE = re.compile(r'<RuntimeIdentifiers?>(.*?)</RuntimeIdentifiers?>', re.IGNORECASE | re.DOTALL)
+_RID_OPEN = '<runtimeidentifier'
+_RID_CLOSE = '</runtimeidentifier'
+_RID_TAGS = frozenset(('runtimeidentifier', 'runtimeidentifiers'))
+
+# Substrings marking native code in package tags and descriptions
+_NATIVE_TAGS = ('native', 'pinvoke', 'interop', 'unmanaged')
+_NATIVE_KEYWORDS = ('native', 'p/invoke', 'interop', 'unmanaged', 'dll')
+
+
+@lru_cache(maxsize=8192)
+def _parse_version(version: str) -> Tuple[int, ...]:
+    """Parse a .NET version (e.g., 1.0.0, 2.1.3-preview) into numeric parts, memoized."""
+    # Remove pre-release suffixes
+    base = version.split('-', 1)[0]
+    return tuple(int(x) for x in base.split('.') if x.isdigit())
+
+
+def _compare_parsed(parts1: Tuple[int, ...], parts2: Tuple[int, ...]) -> int:
+    """Compare parsed versions, returning -1, 0 or 1."""
+    # Pad shorter version with zeros
+    max_len = max(len(parts1), len(parts2))
+    parts1 += (0,) * (max_len - len(parts1))
+    parts2 += (0,) * (max_len - len(parts2))
+    
+    # Equal-length tuples compare lexicographically in C
+    return (parts1 > parts2) - (parts1 < parts2)
+
+
+# Range prefixes in match order; two-character operators must come first
+_RANGE_OPERATORS = (
+    ('>=', operator.ge),
+    ('>', operator.gt),
+    ('<=', operator.le),
+    ('<', operator.lt),
+)
+
+
+@lru_cache(maxsize=1024)
+def _compile_range(version_range: str) -> Callable[[str], bool]:
+    """Compile a KB version range into a predicate over version strings.
+    
+    The range is parsed once per distinct string; the returned predicate
+    only parses (via the cached _parse_version) and compares the version.
+    """
+    for prefix, compare in _RANGE_OPERATORS:
+        if version_range.startswith(prefix):
+            bound = _parse_version(version_range[len(prefix):].strip())
+            return lambda version: compare(_compare_parsed(_parse_version(version), bound), 0)
+    
+    if version_range.startswith('='):
+        exact_version = version_range.lstrip('=').strip()
+        return lambda version: version == exact_version
+    return lambda version: version == version_range
+
+
+def _native_scan_fields(package_data: Dict) -> Tuple[List[str], str, str]:
+    """Normalize the package fields scanned for native dependency indicators.
+    
+    Returns:
+        Tuple of (tags, newline-joined lowercase tags, lowercase description).
+        The newline separator cannot be part of a keyword, so scanning the
+        joined string never matches across tag boundaries.
+    """
+    tags = package_data.get('tags')
+    if not isinstance(tags, list):
+        tags = []
+    joined_tags = '\n'.join(tags).lower() if tags else ''
+    description = (package_data.get('description') or '').lower()
+    return tags, joined_tags, description
+
+
+def _extract_rid_blocks(manifest: str) -> Iterator[str]:
+    """Extract the contents of <RuntimeIdentifier(s)> elements from a manifest.
+    
+    Yields the same blocks as _RID_RE.findall() but uses str.find scanning,
+    which is much cheaper for manifests holding zero or one such element.
+    Blocks are yielded lazily so no intermediate list is built.
+    """
+    lowered = manifest.lower()
+    if len(lowered) != len(manifest):
+        # Lowercasing changed offsets (rare non-ASCII case); slicing would be wrong
+        for match in _RID_RE.finditer(manifest):
+            yield match.group(1)
+        return
+    
+    pos = lowered.find(_RID_OPEN)
+    while pos != -1:
+        start = pos + len(_RID_OPEN)
+        if lowered.startswith('s>', start):
+            start += 2
+        elif lowered.startswith('>', start):
+            start += 1
+        else:
+            pos = lowered.find(_RID_OPEN, start)
+            continue
+        
+        # Earliest closing tag of either form ends the block
+        end = lowered.find(_RID_CLOSE, start)
+        while end != -1:
+            after = end + len(_RID_CLOSE)
+            if lowered.startswith('>', after):
+                resume = after + 1
+                break
+            if lowered.startswith('s>', after):
+                resume = after + 2
+                break
+            end = lowered.find(_RID_CLOSE, after)
+        if end == -1:
+            break
+        
+        yield manifest[start:end]
+        pos = lowered.find(_RID_OPEN, resume)
+
+
+def _parse_rid_elements(manifest: str) -> Optional[List[str]]:
+    """Extract RuntimeIdentifier(s) element text using the expat XML parser.
+    
+    Returns:
+        List of element texts, or None if the manifest is not well-formed XML
+    """
+    try:
+        root = ET.fromstring(manifest)
+    except (ET.ParseError, ValueError):
+        return None
+    return [
+        element.text or ''
+        for element in root.iter()
+        if isinstance(element.tag, str) and element.tag.rsplit('}', 1)[-1].lower() in _RID_TAGS
+    ]
+
+
+# Notes of the KB miss result; only ever produced by _create_kb_not_found_result
+_KB_NOT_FOUND_NOTE = "Package not found in knowledge base"
+
+
+def _kb_has_info(kb_result: ComponentResult) -> bool:
+    """Check whether an UNKNOWN KB result still carries meaningful notes."""
+    notes = kb_result.compatibility.notes
+    # Compare by value: results unpickled from the KB worker processes carry copies of the note
+    return bool(notes) and notes != _KB_NOT_FOUND_NOTE
+
+
+# Status lookup by value, avoiding Enum.__call__ on every conversion
+_STATUS_BY_VALUE = {status.value: status for status in CompatibilityStatus}
+
+
+def _to_status(value) -> CompatibilityStatus:
+    """Convert a status value to CompatibilityStatus.
+    
+    Invalid values map to UNKNOWN.
+    """
+    status = _STATUS_BY_VALUE.get(value)
+    if status is not None:
+        return status
+    if isinstance(value, CompatibilityStatus):
+        return value
+    logger.warning(f"Invalid status value '{value}', defaulting to UNKNOWN")
+    return CompatibilityStatus.UNKNOWN
+
 
 class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
     """.NET runtime compatibility analyzer with NuGet API metadata analysis."""
@@ -36,27 +212,50 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': 'graviton-validator/1.0'})
         
+        # Maximum concurrent NuGet requests for async batch analysis
+        self.nuget_pool_size = self.config.get('nuget_pool_size', 16)
+        
+        # Batch size above which KB analysis is spread across processes
+        self.kb_parallel_threshold = self.config.get('kb_parallel_threshold', 5000)
+        
         # Initialize cache manager
         self.cache_manager = get_cache_manager()
         
         # Load .NET runtime knowledge base
         self.kb_loader = RuntimeKnowledgeBaseLoader()
         self.runtime_kb = self.kb_loader.load_dotnet_knowledge_base()
+        # KB entries keyed by lowercased name (NuGet package IDs are case-insensitive);
+        # a component whose lowercased name is absent is guaranteed to miss the KB
+        self._runtime_kb_ci = {}
+        for name, package_info in self.runtime_kb.items():
+            self._runtime_kb_ci.setdefault(sys.intern(name.lower()), package_info)
+        
+        # Interned lowercase package names, shared by KB lookups and URL builders
+        self._lowered_names: Dict[str, str] = {}
+        
+        # Invariant part of get_analyzer_info
+        self._static_info = {
+            'runtime_type': self.get_runtime_type(),
+            'metadata_lookup_enabled': self.metadata_lookup_enabled,
+            'offline_mode': self.offline_mode,
+            'nuget_api_url': self.nuget_api_url,
+            'knowledge_base_entries': len(self.runtime_kb) if self.runtime_kb else 0
+        }
         
         # ARM64 runtime identifiers
-        self.arm64_rids = {
+        self.arm64_rids = frozenset((
             'linux-arm64',
             'osx-arm64',
             'win-arm64',
             'any'
-        }
+        ))
         
         # .NET target frameworks that support ARM64
-        self.arm64_frameworks = {
+        self.arm64_frameworks = frozenset((
             'net5.0', 'net6.0', 'net7.0', 'net8.0',
             'netcoreapp3.0', 'netcoreapp3.1',
             'netstandard2.0', 'netstandard2.1'
-        }
+        ))
         
     def analyze_component(self, component: SoftwareComponent) -> ComponentResult:
         """Analyze .NET component for Graviton compatibility.
@@ -78,8 +277,7 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
             logger.debug(f"Knowledge base analysis returned UNKNOWN for {component.name}: {kb_result.compatibility.notes}")
         
         # Check if KB had meaningful information even with UNKNOWN status
-        kb_has_info = (kb_result.compatibility.notes and 
-                      kb_result.compatibility.notes != "Package not found in knowledge base")
+        kb_has_info = _kb_has_info(kb_result)
         
         # Phase 2: Metadata Analysis (Secondary)
         if self.metadata_lookup_enabled and not self.offline_mode and not kb_has_info:
@@ -99,7 +297,10 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
             return kb_result
         
         logger.debug(f"No compatibility information found for {component.name} after all analysis phases")
-        
+        return self._create_fallback_result(component)
+    
+    def _create_fallback_result(self, component: SoftwareComponent) -> ComponentResult:
+        """Create the UNKNOWN result returned when no analysis phase produced information."""
         # Add analysis details for the fallback case
         analysis_details = f".NET analysis: kb_lookup=not_found, nuget_lookup={'disabled' if not self.metadata_lookup_enabled or self.offline_mode else 'failed'}, metadata_available=False"
         
@@ -114,6 +315,13 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
             )
         )
     
+    def _lower_name(self, name: str) -> str:
+        """Return the interned lowercase form of a package name, computed once per name."""
+        lowered = self._lowered_names.get(name)
+        if lowered is None:
+            lowered = self._lowered_names[name] = sys.intern(name.lower())
+        return lowered
+    
     def _analyze_with_knowledge_base(self, component: SoftwareComponent) -> ComponentResult:
         """Analyze component using runtime knowledge base.
         
@@ -123,20 +331,11 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
         Returns:
             ComponentResult from knowledge base analysis
         """
-        package_info = self.runtime_kb.get(component.name) or self.runtime_kb.get(component.name.lower())
+        package_info = self.runtime_kb.get(component.name) or self._runtime_kb_ci.get(self._lower_name(component.name))
         if not package_info:
-            logger.debug(f"Package {component.name} not found in .NET knowledge base (searched for: {component.name}, {component.name.lower()})")
+            logger.debug(f"Package {component.name} not found in .NET knowledge base (searched for: {component.name}, {self._lower_name(component.name)})")
             logger.debug(f"Available packages in knowledge base: {list(self.runtime_kb.keys())[:10]}..." if self.runtime_kb else "Knowledge base is empty")
-            return ComponentResult(
-                component=component,
-                compatibility=CompatibilityResult(
-                    status=CompatibilityStatus.UNKNOWN,
-                    current_version_supported=False,
-                    minimum_supported_version=None,
-                    recommended_version=None,
-                    notes="Package not found in knowledge base"
-                )
-            )
+            return self._create_kb_not_found_result(component)
         else:
             logger.debug(f"Found {component.name} in .NET knowledge base with status: {package_info.get('default_status', 'unknown')}")
         
@@ -148,19 +347,10 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
         # Check version compatibility
         version_info = self._check_version_compatibility(version, package_info)
         if version_info:
-            # Ensure status is a CompatibilityStatus enum
-            status = version_info['status']
-            if isinstance(status, str):
-                try:
-                    status = CompatibilityStatus(status)
-                except ValueError:
-                    logger.warning(f"Invalid status string '{status}' for {component.name}, defaulting to UNKNOWN")
-                    status = CompatibilityStatus.UNKNOWN
-            
             return ComponentResult(
                 component=component,
                 compatibility=CompatibilityResult(
-                    status=status,
+                    status=version_info['status'],
                     current_version_supported=True,
                     minimum_supported_version=None,
                     recommended_version=None,
@@ -207,13 +397,7 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
             )
         
         # Default to package-level compatibility
-        default_status = package_info.get('default_status', CompatibilityStatus.UNKNOWN)
-        if isinstance(default_status, str):
-            try:
-                default_status = CompatibilityStatus(default_status)
-            except ValueError:
-                logger.warning(f"Invalid default status string '{default_status}' for {component.name}, using UNKNOWN")
-                default_status = CompatibilityStatus.UNKNOWN
+        default_status = _to_status(package_info.get('default_status', CompatibilityStatus.UNKNOWN))
         
         return ComponentResult(
             component=component,
@@ -226,6 +410,19 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
             )
         )
     
+    def _create_kb_not_found_result(self, component: SoftwareComponent) -> ComponentResult:
+        """Create the UNKNOWN result for a component missing from the knowledge base."""
+        return ComponentResult(
+            component=component,
+            compatibility=CompatibilityResult(
+                status=CompatibilityStatus.UNKNOWN,
+                current_version_supported=False,
+                minimum_supported_version=None,
+                recommended_version=None,
+                notes=_KB_NOT_FOUND_NOTE
+            )
+        )
+    
     def _analyze_with_nuget_metadata(self, component: SoftwareComponent) -> ComponentResult:
         """Analyze component using NuGet API metadata with caching.
         
@@ -245,55 +442,27 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
             logger.debug(f"Fetching NuGet metadata for {component.name}@{component.version}")
             # Get package metadata from NuGet API
             package_data = self._fetch_nuget_metadata_with_cache(component.name, component.version)
+            return self._build_nuget_result(component, package_data)
             
-            if not package_data:
-                logger.debug(f"No package data returned for {component.name}")
-                # Log API call details for debugging
-                logger.info(f"DEBUG: NuGet API call failed for {component.name}@{component.version}")
-                logger.info(f"DEBUG: NuGet URLs attempted: {self.nuget_api_url}/{component.name.lower()}/index.json")
-                
-                result = ComponentResult(
-                    component=component,
-                    compatibility=CompatibilityResult(
-                        status=CompatibilityStatus.UNKNOWN,
-                        current_version_supported=False,
-                        minimum_supported_version=None,
-                        recommended_version=None,
-                        notes="Package metadata not available from NuGet API"
-                    )
-                )
-                # Cache negative result with 24h TTL
-                self.cache_manager.set_cached('nuget', component.name, {
-                    'status': 'unknown',
-                    'notes': 'Package not found on NuGet'
-                }, component.version, ttl_hours=24)
-                return result
-            
-            logger.debug(f"Analyzing ARM64 compatibility for {component.name}")
-            # Analyze ARM64 compatibility
-            compatibility_result = self._analyze_arm64_compatibility(package_data, component)
-            
-            # Cache result based on status
-            cache_data = {
-                'status': compatibility_result.compatibility.status.value,
-                'current_version_supported': compatibility_result.compatibility.current_version_supported,
-                'notes': compatibility_result.compatibility.notes,
-                'package_data': package_data
-            }
-            
-            # Use 24h TTL for non-compatible/non-upgrade results
-            ttl_hours = None
-            if compatibility_result.compatibility.status in [CompatibilityStatus.UNKNOWN, CompatibilityStatus.NEEDS_VERIFICATION]:
-                ttl_hours = 24
-            
-            self.cache_manager.set_cached('nuget', component.name, cache_data, component.version, ttl_hours=ttl_hours)
-            logger.debug(f"Cached NuGet result for {component.name}@{component.version}" + (f" (TTL: {ttl_hours}h)" if ttl_hours else ""))
+        except Exception as e:
+            return self._create_nuget_error_result(component, e)
+    
+    def _build_nuget_result(self, component: SoftwareComponent, package_data: Optional[Dict]) -> ComponentResult:
+        """Analyze fetched NuGet metadata and cache the outcome.
+        
+        Args:
+            component: Component being analyzed
+            package_data: Package metadata from NuGet, or None if the lookup failed
             
-            return compatibility_result
+        Returns:
+            ComponentResult from metadata analysis
+        """
+        if not package_data:
+            logger.debug(f"No package data returned for {component.name}")
+            # Log API call details for debugging
+            logger.info(f"DEBUG: NuGet API call failed for {component.name}@{component.version}")
+            logger.info(f"DEBUG: NuGet URLs attempted: {self.nuget_api_url}/{self._lower_name(component.name)}/index.json")
             
-        except Exception as e:
-            logger.error(f"NuGet metadata analysis failed for {component.name}: {e}", exc_info=True)
-            self.cache_manager.record_request('nuget', success=False)
             result = ComponentResult(
                 component=component,
                 compatibility=CompatibilityResult(
@@ -301,27 +470,65 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
                     current_version_supported=False,
                     minimum_supported_version=None,
                     recommended_version=None,
-                    notes=f"Metadata analysis failed: {str(e)}"
+                    notes="Package metadata not available from NuGet API"
                 )
             )
-            # Cache error result with 24h TTL
+            # Cache negative result with 24h TTL
             self.cache_manager.set_cached('nuget', component.name, {
                 'status': 'unknown',
-                'notes': result.compatibility.notes
+                'notes': 'Package not found on NuGet'
             }, component.version, ttl_hours=24)
             return result
+        
+        logger.debug(f"Analyzing ARM64 compatibility for {component.name}")
+        # Analyze ARM64 compatibility
+        compatibility_result = self._analyze_arm64_compatibility(package_data, component)
+        
+        # Cache result based on status
+        cache_data = {
+            'status': compatibility_result.compatibility.status.value,
+            'current_version_supported': compatibility_result.compatibility.current_version_supported,
+            'notes': compatibility_result.compatibility.notes,
+            'package_data': package_data
+        }
+        
+        # Use 24h TTL for non-compatible/non-upgrade results
+        ttl_hours = None
+        if compatibility_result.compatibility.status in [CompatibilityStatus.UNKNOWN, CompatibilityStatus.NEEDS_VERIFICATION]:
+            ttl_hours = 24
+        
+        self.cache_manager.set_cached('nuget', component.name, cache_data, component.version, ttl_hours=ttl_hours)
+        logger.debug(f"Cached NuGet result for {component.name}@{component.version}" + (f" (TTL: {ttl_hours}h)" if ttl_hours else ""))
+        
+        return compatibility_result
+    
+    def _create_nuget_error_result(self, component: SoftwareComponent, error: Exception) -> ComponentResult:
+        """Create and cache an UNKNOWN result for a failed NuGet analysis."""
+        logger.error(f"NuGet metadata analysis failed for {component.name}: {error}", exc_info=True)
+        self.cache_manager.record_request('nuget', success=False)
+        result = ComponentResult(
+            component=component,
+            compatibility=CompatibilityResult(
+                status=CompatibilityStatus.UNKNOWN,
+                current_version_supported=False,
+                minimum_supported_version=None,
+                recommended_version=None,
+                notes=f"Metadata analysis failed: {str(error)}"
+            )
+        )
+        # Cache error result with 24h TTL
+        self.cache_manager.set_cached('nuget', component.name, {
+            'status': 'unknown',
+            'notes': result.compatibility.notes
+        }, component.version, ttl_hours=24)
+        return result
     
     def _create_result_from_cached_data(self, component: SoftwareComponent, cached_data: Dict) -> ComponentResult:
         """Create ComponentResult from cached data."""
-        try:
-            status = CompatibilityStatus(cached_data['status'])
-        except (ValueError, KeyError):
-            status = CompatibilityStatus.UNKNOWN
-        
         return ComponentResult(
             component=component,
             compatibility=CompatibilityResult(
-                status=status,
+                status=_to_status(cached_data.get('status', 'unknown')),
                 current_version_supported=cached_data.get('current_version_supported', False),
                 minimum_supported_version=cached_data.get('minimum_supported_version'),
                 recommended_version=cached_data.get('recommended_version'),
@@ -362,7 +569,8 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
         try:
             logger.debug(f"Fetching versions for {package_name} from NuGet API")
             # First try to get package versions
-            versions_url = f"{self.nuget_api_url}/{package_name.lower()}/index.json"
+            name_lower = self._lower_name(package_name)
+            versions_url = f"{self.nuget_api_url}/{name_lower}/index.json"
             response = self.session.get(versions_url, timeout=10)
             
             logger.debug(f"NuGet versions API response for {package_name}: status={response.status_code}")
@@ -393,16 +601,16 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
             
             # Get package manifest (.nuspec)
             logger.debug(f"Fetching manifest for {package_name}@{target_version}")
-            manifest_url = f"{self.nuget_api_url}/{package_name.lower()}/{target_version}/{package_name.lower()}.nuspec"
-            manifest_response = self.session.get(manifest_url, timeout=10)
-            
-            if manifest_response.status_code == 200:
-                return {
-                    'versions': available_versions,
-                    'target_version': target_version,
-                    'manifest': manifest_response.text,
-                    'package_name': package_name
-                }
+            manifest_url = f"{self.nuget_api_url}/{name_lower}/{target_version}/{name_lower}.nuspec"
+            # Stream the body so error responses are never downloaded
+            with self.session.get(manifest_url, timeout=10, stream=True) as manifest_response:
+                if manifest_response.status_code == 200:
+                    return {
+                        'versions': available_versions,
+                        'target_version': target_version,
+                        'manifest': self._read_manifest(manifest_response),
+                        'package_name': package_name
+                    }
             
             # Fallback to search API for basic metadata
             return self._fetch_nuget_search_metadata(package_name)
@@ -414,6 +622,18 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
             logger.error(f"Unexpected error fetching NuGet metadata for {package_name}: {e}", exc_info=True)
             return None
     
+    @staticmethod
+    def _read_manifest(response: requests.Response) -> str:
+        """Read a streamed .nuspec body, decoding it as UTF-8.
+        
+        The session negotiates gzip by default; decode_content makes urllib3
+        inflate the body while reading. Decoding directly as UTF-8 (the XML
+        default) avoids the charset detection pass response.text runs when
+        the server sends no charset.
+        """
+        response.raw.decode_content = True
+        return response.raw.read().decode('utf-8-sig', errors='replace')
+    
     def _fetch_nuget_search_metadata(self, package_name: str) -> Optional[Dict]:
         """Fetch package metadata from NuGet search API.
         
@@ -442,6 +662,116 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
             logger.warning(f"Failed to fetch NuGet search metadata for {package_name}: {e}")
             return None
     
+    async def _analyze_with_nuget_metadata_all(self, components: List[SoftwareComponent]) -> List[ComponentResult]:
+        """Run NuGet metadata analysis for all components concurrently."""
+        semaphore = asyncio.Semaphore(self.nuget_pool_size)
+        async with self._create_aio_session() as session:
+            return list(await asyncio.gather(
+                *(self._analyze_with_nuget_metadata_async(session, semaphore, component) for component in components)
+            ))
+    
+    def _create_aio_session(self):
+        """Create a pooled aiohttp session mirroring the requests session headers."""
+        connector = aiohttp.TCPConnector(
+            limit=self.nuget_pool_size,
+            limit_per_host=self.nuget_pool_size,
+            ttl_dns_cache=600
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=dict(self.session.headers),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+    
+    @staticmethod
+    def _can_run_async() -> bool:
+        """Check whether a sync caller can drive the async NuGet path via asyncio.run."""
+        if not AIOHTTP_AVAILABLE:
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+        return False  # Already inside an event loop; asyncio.run would fail
+    
+    async def _analyze_with_nuget_metadata_async(self, session, semaphore: asyncio.Semaphore,
+                                                 component: SoftwareComponent) -> ComponentResult:
+        """Async counterpart of _analyze_with_nuget_metadata."""
+        try:
+            cached_result = self.cache_manager.get_cached('nuget', component.name, component.version)
+            if cached_result is not None:
+                logger.debug(f"Using cached NuGet result for {component.name}@{component.version}")
+                return self._create_result_from_cached_data(component, cached_result)
+            
+            async with semaphore:
+                await self.cache_manager.wait_for_rate_limit_async('nuget')
+                if not self.cache_manager.can_make_request('nuget'):
+                    logger.warning(f"Rate limit still exceeded for NuGet API after waiting, skipping {component.name}")
+                    package_data = None
+                else:
+                    package_data = await self._fetch_nuget_metadata_async(session, component.name, component.version)
+                    self.cache_manager.record_request('nuget', success=package_data is not None)
+            
+            return self._build_nuget_result(component, package_data)
+            
+        except Exception as e:
+            return self._create_nuget_error_result(component, e)
+    
+    async def _fetch_nuget_metadata_async(self, session, package_name: str, version: Optional[str] = None) -> Optional[Dict]:
+        """Fetch package metadata from NuGet API using an aiohttp session.
+        
+        Args:
+            session: Shared aiohttp ClientSession
+            package_name: Name of the package
+            version: Specific version to fetch (optional)
+            
+        Returns:
+            Package metadata dictionary or None if not found
+        """
+        try:
+            name_lower = self._lower_name(package_name)
+            versions_url = f"{self.nuget_api_url}/{name_lower}/index.json"
+            async with session.get(versions_url) as response:
+                if response.status != 200:
+                    logger.debug(f"Package {package_name} not found on NuGet (status: {response.status})")
+                    return None
+                versions_data = await response.json(content_type=None)
+            
+            available_versions = versions_data.get('versions', [])
+            if not available_versions:
+                logger.debug(f"No versions found for {package_name}")
+                return None
+            
+            # Use specified version or latest
+            target_version = version if version in available_versions else available_versions[-1]
+            
+            manifest_url = f"{self.nuget_api_url}/{name_lower}/{target_version}/{name_lower}.nuspec"
+            async with session.get(manifest_url) as manifest_response:
+                if manifest_response.status == 200:
+                    return {
+                        'versions': available_versions,
+                        'target_version': target_version,
+                        'manifest': (await manifest_response.read()).decode('utf-8-sig', errors='replace'),
+                        'package_name': package_name
+                    }
+            
+            # Fallback to search API for basic metadata
+            params = {'q': f'packageid:{package_name}', 'take': '1'}
+            async with session.get(self.nuget_search_url, params=params) as search_response:
+                if search_response.status == 200:
+                    search_data = await search_response.json(content_type=None)
+                    data = search_data.get('data', [])
+                    if data:
+                        return data[0]
+            return None
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Request failed for NuGet metadata {package_name}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error fetching NuGet metadata for {package_name}: {e}", exc_info=True)
+            return None
+    
     def _analyze_arm64_compatibility(self, package_data: Dict, component: SoftwareComponent) -> ComponentResult:
         """Analyze ARM64 compatibility from package metadata.
         
@@ -452,7 +782,8 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
         Returns:
             ComponentResult with compatibility analysis
         """
-        # Validate package_data is a dictionary
+        # Validate package_data is a dictionary; the _check_* helpers below
+        # rely on this single check instead of re-validating
         if not isinstance(package_data, dict):
             logger.warning(f"Invalid package data type for {component.name}: expected dict, got {type(package_data)}")
             return ComponentResult(
@@ -510,7 +841,8 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
             )
         
         # Check if it's a pure managed assembly
-        if self._is_pure_managed(package_data):
+        pure_managed = self._is_pure_managed(native_deps)
+        if pure_managed:
             return ComponentResult(
                 component=component,
                 compatibility=CompatibilityResult(
@@ -526,19 +858,16 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
         logger.debug(f"NuGet analysis for {component.name}@{component.version} resulted in UNKNOWN status")
         logger.debug(f"Package data available: {bool(package_data)}")
         
-        framework_info = self._check_framework_support(package_data) if package_data else {}
-        rid_info = self._check_runtime_identifiers(package_data) if package_data else {}
-        native_info = self._check_native_dependencies(package_data) if package_data else {}
-        
+        # Reuse the checks computed above rather than re-scanning the manifest
         if package_data:
             logger.debug(f"Package data keys: {list(package_data.keys())}")
             logger.debug(f"Available versions: {len(package_data.get('versions', []))} versions")
             logger.debug(f"Target version: {package_data.get('target_version', 'unknown')}")
-            logger.debug(f"Framework analysis: {framework_info}")
-            logger.debug(f"Runtime ID analysis: {rid_info}")
-            logger.debug(f"Native dependency analysis: {native_info}")
+            logger.debug(f"Framework analysis: {framework_support}")
+            logger.debug(f"Runtime ID analysis: {rid_support}")
+            logger.debug(f"Native dependency analysis: {native_deps}")
         
-        analysis_details = f"NuGet analysis: arm64_frameworks={framework_info.get('has_arm64_frameworks', False)}, arm64_rids={rid_info.get('has_arm64_rids', False)}, native_deps={native_info.get('has_native_deps', False)}, pure_managed={self._is_pure_managed(package_data) if package_data else False}"
+        analysis_details = f"NuGet analysis: arm64_frameworks={framework_support['has_arm64_frameworks']}, arm64_rids={rid_support['has_arm64_rids']}, native_deps={native_deps['has_native_deps']}, pure_managed={pure_managed and bool(package_data)}"
         
         return ComponentResult(
             component=component,
@@ -555,7 +884,7 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
         """Check target framework support for ARM64.
         
         Args:
-            package_data: Package metadata
+            package_data: Package metadata (a dict, validated by _analyze_arm64_compatibility)
             
         Returns:
             Dictionary with framework support analysis
@@ -566,10 +895,6 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
             'all_frameworks': []
         }
         
-        # Validate input
-        if not isinstance(package_data, dict):
-            return result
-        
         # Extract frameworks from search API data
         if 'versions' in package_data and isinstance(package_data['versions'], list):
             for version_info in package_data['versions']:
@@ -604,9 +929,9 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
                     result['has_arm64_frameworks'] = True
                     result['arm64_frameworks'].append(framework_name)
         
-        # Remove duplicates
-        result['arm64_frameworks'] = list(set(result['arm64_frameworks']))
-        result['all_frameworks'] = list(set(result['all_frameworks']))
+        # Remove duplicates, preserving encounter order
+        result['arm64_frameworks'] = list(dict.fromkeys(result['arm64_frameworks']))
+        result['all_frameworks'] = list(dict.fromkeys(result['all_frameworks']))
         
         return result
     
@@ -614,7 +939,7 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
         """Check runtime identifiers for ARM64 support.
         
         Args:
-            package_data: Package metadata
+            package_data: Package metadata (a dict, validated by _analyze_arm64_compatibility)
             
         Returns:
             Dictionary with RID support analysis
@@ -625,38 +950,42 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
             'all_rids': []
         }
         
-        # Validate input
-        if not isinstance(package_data, dict):
-            return result
-        
         # Parse manifest XML for runtime identifiers (simplified)
         manifest = package_data.get('manifest', '')
         if manifest:
-            # Look for runtime identifiers in manifest
-            import re
-            rid_pattern = r'<RuntimeIdentifiers?>(.*?)</RuntimeIdentifiers?>'
-            rid_matches = re.findall(rid_pattern, manifest, re.IGNORECASE | re.DOTALL)
+            # Cheap scan first; most manifests declare no RIDs at all
+            rid_blocks = list(_extract_rid_blocks(manifest))
+            if rid_blocks:
+                # Confirm with a real XML parse, which ignores RIDs inside
+                # comments; keep the scan result if the manifest is not XML
+                xml_blocks = _parse_rid_elements(manifest)
+                if xml_blocks is not None:
+                    rid_blocks = xml_blocks
             
-            for match in rid_matches:
+            for match in rid_blocks:
                 rids = [rid.strip() for rid in match.split(';') if rid.strip()]
                 result['all_rids'].extend(rids)
                 
                 for rid in rids:
-                    if any(arm64_rid in rid.lower() for arm64_rid in self.arm64_rids):
+                    if self._is_arm64_rid(rid.lower()):
                         result['has_arm64_rids'] = True
                         result['arm64_rids'].append(rid)
         
-        # Remove duplicates
-        result['arm64_rids'] = list(set(result['arm64_rids']))
-        result['all_rids'] = list(set(result['all_rids']))
+        # Remove duplicates, preserving manifest order
+        result['arm64_rids'] = list(dict.fromkeys(result['arm64_rids']))
+        result['all_rids'] = list(dict.fromkeys(result['all_rids']))
         
         return result
     
+    def _is_arm64_rid(self, rid_lower: str) -> bool:
+        """Check whether a lowercased RID contains any ARM64 RID substring."""
+        return any(arm64_rid in rid_lower for arm64_rid in self.arm64_rids)
+    
     def _check_native_dependencies(self, package_data: Dict) -> Dict[str, any]:
         """Check for native dependencies.
         
         Args:
-            package_data: Package metadata
+            package_data: Package metadata (a dict, validated by _analyze_arm64_compatibility)
             
         Returns:
             Dictionary with native dependency analysis
@@ -666,23 +995,19 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
             'native_indicators': []
         }
         
-        # Validate input
-        if not isinstance(package_data, dict):
-            return result
+        tags, joined_tags, description = _native_scan_fields(package_data)
         
         # Check package tags for native indicators
-        tags = package_data.get('tags', [])
-        if isinstance(tags, list):
-            native_tags = ['native', 'pinvoke', 'interop', 'unmanaged']
+        if any(native_tag in joined_tags for native_tag in _NATIVE_TAGS):
+            # Attribute the match to individual tags only when there is one
             for tag in tags:
-                if any(native_tag in tag.lower() for native_tag in native_tags):
+                tag_lower = tag.lower()
+                if any(native_tag in tag_lower for native_tag in _NATIVE_TAGS):
                     result['has_native_deps'] = True
                     result['native_indicators'].append(f"tag: {tag}")
         
         # Check description for native indicators
-        description = package_data.get('description', '').lower()
-        native_keywords = ['native', 'p/invoke', 'interop', 'unmanaged', 'dll']
-        for keyword in native_keywords:
+        for keyword in _NATIVE_KEYWORDS:
             if keyword in description:
                 result['has_native_deps'] = True
                 result['native_indicators'].append(f"description: {keyword}")
@@ -690,37 +1015,18 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
         
         return result
     
-    def _is_pure_managed(self, package_data: Dict) -> bool:
+    def _is_pure_managed(self, native_deps: Dict) -> bool:
         """Check if package is pure managed code.
         
         Args:
-            package_data: Package metadata
+            native_deps: Result of _check_native_dependencies for the package
             
         Returns:
             True if package appears to be pure managed code
         """
-        # Validate input
-        if not isinstance(package_data, dict):
-            return True  # Default to managed if invalid data
-        
-        # Check for absence of native dependencies
-        native_deps = self._check_native_dependencies(package_data)
-        if native_deps['has_native_deps']:
-            return False
-        
-        # Check target frameworks - modern frameworks are good indicators
-        framework_support = self._check_framework_support(package_data)
-        if framework_support['has_arm64_frameworks']:
-            return True
-        
-        # Check for managed code indicators
-        tags = package_data.get('tags', [])
-        if isinstance(tags, list):
-            managed_tags = ['managed', 'dotnet', 'csharp', 'vb.net']
-            if any(tag.lower() in managed_tags for tag in tags):
-                return True
-        
-        return True  # Default to managed if no native indicators
+        # Framework and managed-tag indicators can only confirm managed code,
+        # which is already the default, so absence of native deps decides
+        return not native_deps['has_native_deps']
     
     def _check_version_compatibility(self, version: str, package_info: Dict) -> Optional[Dict]:
         """Check version-specific compatibility information.
@@ -737,7 +1043,7 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
         for version_range in version_ranges:
             if self._version_matches_range(version, version_range.get('range', '')):
                 return {
-                    'status': CompatibilityStatus(version_range.get('status', 'unknown')),
+                    'status': _to_status(version_range.get('status', 'unknown')),
                     'notes': version_range.get('notes', ''),
                     'recommendations': version_range.get('recommendations', [])
                 }
@@ -762,23 +1068,7 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
         if not version:
             return False
         
-        if version_range.startswith('>='):
-            min_version = version_range[2:].strip()
-            return self._compare_versions(version, min_version) >= 0
-        elif version_range.startswith('>'):
-            min_version = version_range[1:].strip()
-            return self._compare_versions(version, min_version) > 0
-        elif version_range.startswith('<='):
-            max_version = version_range[2:].strip()
-            return self._compare_versions(version, max_version) <= 0
-        elif version_range.startswith('<'):
-            max_version = version_range[1:].strip()
-            return self._compare_versions(version, max_version) < 0
-        elif version_range.startswith('==') or version_range.startswith('='):
-            exact_version = version_range.lstrip('=').strip()
-            return version == exact_version
-        else:
-            return version == version_range
+        return _compile_range(version_range)(version)
     
     def _compare_versions(self, v1: str, v2: str) -> int:
         """Simple version comparison for .NET versions.
@@ -790,28 +1080,7 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
         Returns:
             -1 if v1 < v2, 0 if v1 == v2, 1 if v1 > v2
         """
-        # Handle .NET version formats (e.g., 1.0.0, 2.1.3-preview)
-        def parse_version(v):
-            # Remove pre-release suffixes
-            v = v.split('-')[0]
-            return [int(x) for x in v.split('.') if x.isdigit()]
-        
-        parts1 = parse_version(v1)
-        parts2 = parse_version(v2)
-        
-        # Pad shorter version with zeros
-        max_len = max(len(parts1), len(parts2))
-        parts1.extend([0] * (max_len - len(parts1)))
-        parts2.extend([0] * (max_len - len(parts2)))
-        
-        # Compare parts
-        for p1, p2 in zip(parts1, parts2):
-            if p1 < p2:
-                return -1
-            elif p1 > p2:
-                return 1
-        
-        return 0
+        return _compare_parsed(_parse_version(v1), _parse_version(v2))
     
     def get_runtime_type(self) -> str:
         """Return the runtime type this analyzer handles."""
@@ -824,11 +1093,45 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
     def analyze_components_batch(self, components: List[SoftwareComponent]) -> List[ComponentResult]:
         """Analyze multiple components with batch optimization.
         
+        SBOMs often list the same package and version several times, so each
+        distinct (name, version) pair is analyzed once and its result is
+        copied to every duplicate.
+        
         Args:
             components: List of components to analyze
             
         Returns:
-            List of ComponentResults
+            List of ComponentResults in input order
+        """
+        groups: Dict[Tuple[str, Optional[str]], List[SoftwareComponent]] = {}
+        for component in components:
+            groups.setdefault((component.name, component.version), []).append(component)
+        if len(groups) < len(components):
+            logger.debug(f"Analyzing {len(groups)} distinct .NET packages for {len(components)} components")
+        
+        representatives = [members[0] for members in groups.values()]
+        results_by_key = {
+            (result.component.name, result.component.version): result
+            for result in self._analyze_distinct_components(representatives)
+        }
+        
+        results = []
+        for component in components:
+            result = results_by_key[(component.name, component.version)]
+            if result.component is not component:
+                # Each duplicate gets its own result objects so later mutation stays local
+                result = replace(result, component=component, compatibility=replace(result.compatibility))
+            results.append(result)
+        return results
+    
+    def _analyze_distinct_components(self, components: List[SoftwareComponent]) -> List[ComponentResult]:
+        """Batch analysis for components with distinct (name, version) pairs.
+        
+        Args:
+            components: List of components to analyze
+            
+        Returns:
+            List of ComponentResults, KB-resolved components first
         """
         results = []
         
@@ -836,15 +1139,28 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
         kb_components = []
         api_components = []
         
+        # Run KB analysis for all KB-resident components in one block
+        for component in components:
+            if self._lower_name(component.name) in self._runtime_kb_ci:
+                kb_components.append(component)
+        kb_results = iter(self._analyze_with_knowledge_base_all(kb_components))
+        
         for component in components:
+            # Components absent from the KB skip straight to the NuGet phase
+            if self._lower_name(component.name) not in self._runtime_kb_ci:
+                if self.metadata_lookup_enabled and not self.offline_mode:
+                    api_components.append(component)
+                else:
+                    results.append(self._create_kb_not_found_result(component))
+                continue
+            
             # Check knowledge base first
-            kb_result = self._analyze_with_knowledge_base(component)
+            kb_result = next(kb_results)
             if kb_result.compatibility.status != CompatibilityStatus.UNKNOWN:
                 results.append(kb_result)
             else:
                 # Check if KB had meaningful info
-                kb_has_info = (kb_result.compatibility.notes and 
-                             kb_result.compatibility.notes != "Package not found in knowledge base")
+                kb_has_info = _kb_has_info(kb_result)
                 
                 if kb_has_info:
                     results.append(kb_result)
@@ -864,21 +1180,58 @@ class DotNetRuntimeAnalyzer(RuntimeCompatibilityAnalyzer):
             if uncached_packages:
                 logger.info(f"Fetching metadata for {len(uncached_packages)} uncached packages")
             
-            # Process each component (cache will handle duplicates)
-            for component in api_components:
-                result = self._analyze_with_nuget_metadata(component)
-                results.append(result)
+            # Overlap lookups when several packages need the network
+            if len(uncached_packages) >= 2 and self._can_run_async():
+                results.extend(asyncio.run(self._analyze_with_nuget_metadata_all(api_components)))
+            else:
+                # Process each component (cache will handle duplicates)
+                for component in api_components:
+                    result = self._analyze_with_nuget_metadata(component)
+                    results.append(result)
         
         return results
     
+    def _analyze_with_knowledge_base_all(self, components: List[SoftwareComponent]) -> List[ComponentResult]:
+        """Run knowledge base analysis for many components.
+        
+        KB analysis is CPU-bound and shares no mutable state, so very large
+        batches are spread across a process pool. Smaller batches stay
+        serial, where pool startup and result pickling would dominate.
+        
+        Args:
+            components: Components to analyze
+            
+        Returns:
+            List of ComponentResults in input order
+        """
+        cpu_count = os.cpu_count() or 1
+        if len(components) < self.kb_parallel_threshold or cpu_count < 2:
+            return [self._analyze_with_knowledge_base(component) for component in components]
+        
+        logger.info(f"Analyzing {len(components)} .NET components against knowledge base across {cpu_count} processes")
+        try:
+            with ProcessPoolExecutor(initializer=_init_kb_worker, initargs=(self.config,)) as executor:
+                chunksize = max(32, len(components) // (cpu_count * 4))
+                return list(executor.map(_analyze_kb_in_worker, components, chunksize=chunksize))
+        except Exception as e:
+            logger.warning(f"Parallel knowledge base analysis failed, falling back to serial: {e}")
+            return [self._analyze_with_knowledge_base(component) for component in components]
+    
     def get_analyzer_info(self) -> Dict[str, any]:
         """Get analyzer configuration and status information."""
-        cache_stats = self.cache_manager.get_cache_stats()
-        return {
-            'runtime_type': self.get_runtime_type(),
-            'metadata_lookup_enabled': self.metadata_lookup_enabled,
-            'offline_mode': self.offline_mode,
-            'nuget_api_url': self.nuget_api_url,
-            'knowledge_base_entries': len(self.runtime_kb) if self.runtime_kb else 0,
-            'cache_stats': cache_stats
-        }
\ No newline at end of file
+        return {**self._static_info, 'cache_stats': self.cache_manager.get_cache_stats()}
+
+
+# Per-process analyzer used by _analyze_with_knowledge_base_all workers
+_kb_worker_analyzer: Optional[DotNetRuntimeAnalyzer] = None
+
+
+def _init_kb_worker(config: Optional[Dict]) -> None:
+    """Process pool initializer: build one analyzer (and KB) per worker."""
+    global _kb_worker_analyzer
+    _kb_worker_analyzer = DotNetRuntimeAnalyzer(config)
+
+
+def _analyze_kb_in_worker(component: SoftwareComponent) -> ComponentResult:
+    """Run knowledge base analysis for one component in a worker process."""
+    return _kb_worker_analyzer._analyze_with_knowledge_base(component)
@@ -4,16 +4,30 @@ Execution environment management for multi-runtime dependency analysis.
 Supports both native tool execution and optional containerized isolation.
 """
 
+import collections
+import fnmatch
+import hashlib
+import threading
 import subprocess
 import tempfile
 import shutil
+import signal
 import os
+import re
 import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Not available on Windows; reflink copies are skipped
 
 # Import centralized runtime configurations
 from ..runtime_configs import (
@@ -22,12 +36,322 @@ from ..runtime_configs import (
     get_runtime_default_version,
     get_base_image,
     get_container_config,
-    get_package_manager_info
+    get_package_manager_info,
+    DEFAULT_SUCCESS_CODES
 )
 
 # Configure logger for execution environment
 logger = logging.getLogger(__name__)
 
+# Source locations, resolved once at import so later os.chdir calls cannot change them
+_ANALYSIS_DIR = Path(__file__).resolve().parent
+_MODULE_DIR = _ANALYSIS_DIR.parent
+_REPO_ROOT = _MODULE_DIR.parent
+_MODULE_DIR_STR = str(_MODULE_DIR)
+
+# Bytes of child stdout/stderr kept per stream and analysis; older output is dropped
+MAX_CAPTURED_BYTES = 1024 * 1024
+# Size of each read from a child pipe, so no single line is ever buffered whole
+_DRAIN_CHUNK_BYTES = 64 * 1024
+# Seconds to wait for pipe readers after the child is gone (grandchildren may still hold the pipes)
+_DRAIN_JOIN_TIMEOUT = 5
+
+# Known OS names with an optional "-<version>" or ":<version>" suffix (amazon-linux before amazon)
+_OS_VERSION_RE = re.compile(
+    r'^(?P<name>amazon-linux|amazon|ubuntu|debian|rhel|centos|fedora|alpine)(?:[-:](?P<ver>.+))?$', re.IGNORECASE
+)
+
+# Linux FICLONE ioctl (_IOW(0x94, 9, int)): copy-on-write clone on btrfs/XFS and other reflink filesystems
+FICLONE = 0x40049409
+
+# Tree entries never staged into an analysis work directory. __pycache__ is deliberately kept:
+# the staged sources are hardlinks with unchanged mtimes, so the cached bytecode stays valid.
+STAGE_IGNORE_PATTERNS = ('.git', '.pytest_cache', '.mypy_cache', '*.egg-info', 'tests', '*.log', '*.tmp')
+
+
+def _decode(data: bytes, limit: Optional[int] = None) -> str:
+    """Decode captured subprocess bytes, optionally only the first `limit` bytes (for log excerpts)."""
+    if limit is not None:
+        data = data[:limit]
+    return data.decode('utf-8', errors='replace')
+
+
+@lru_cache(maxsize=None)
+def _probe_tool(tool: str) -> Tuple[bool, str]:
+    """Run `<tool> --version` once per process - returns (available, version output or error)."""
+    try:
+        result = subprocess.run([tool, '--version'], capture_output=True, check=True, timeout=10)
+        return True, result.stdout.decode(errors='replace')
+    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
+        return False, str(e)
+
+
+@lru_cache(maxsize=None)
+def _probe_tools(tools: Tuple[str, ...]) -> Tuple[bool, str]:
+    """Run every `<tool> --version` in a single `sh -c` fork - returns (all available, combined output or error)."""
+    fused = ' && '.join(f'{tool} --version' for tool in tools)
+    try:
+        result = subprocess.run(['sh', '-c', fused], capture_output=True, check=True, timeout=10)
+        return True, _decode(result.stdout)
+    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
+        return False, str(e)
+
+
+def _same_device(path: str, other: str) -> bool:
+    """Whether two existing paths live on one filesystem, so files can be hardlinked between them."""
+    try:
+        return os.stat(path).st_dev == os.stat(other).st_dev
+    except OSError:
+        return False
+
+
+@dataclass(frozen=True)
+class AnalysisPaths:
+    """File locations for one runtime analysis, computed once per run."""
+    manifest_name: str
+    base_name: str
+    work_dir: str
+    output_dir: str
+    output_filename: str
+    output_file_path: str
+
+
+@dataclass(frozen=True)
+class ToolchainRecipe:
+    """What the toolchain RUN installs on one package family ('{version}' in packages is the runtime version)."""
+    packages: Tuple[str, ...]
+    pip_deps: Tuple[str, ...]
+    pip_flags: str = ''
+
+
+@dataclass(frozen=True)
+class RuntimeSpec:
+    """How to build one runtime's analysis image; recipes are keyed by package family (rpm, deb, apk)."""
+    recipes: Dict[str, ToolchainRecipe]
+    base_image: Optional[str] = None  # fixed '{version}' base image; None uses the detected OS image
+    base_family: Optional[str] = None  # package family of the fixed base image
+    alpine_base_image: Optional[str] = None  # '{version}' image used when the OS is alpine
+    default_version: str = 'latest'  # substituted into base images for runtime version 'latest'
+    extra_commands: Tuple[str, ...] = ()  # run after the OS packages, before pip
+    env: Tuple[str, ...] = ()
+
+
+def _output_base_name(manifest_name: str, sbom_name: str = None) -> str:
+    """Base name for output files: the SBOM name, else the manifest name without its last extension."""
+    if sbom_name:
+        return sbom_name
+    head, dot, _ = manifest_name.rpartition('.')
+    return head if dot else manifest_name
+
+
+def _build_paths(runtime: str, manifest_path: str, work_dir: str, sbom_name: str = None) -> AnalysisPaths:
+    """Compute every path an analysis needs from its inputs."""
+    manifest_name = os.path.basename(manifest_path)
+    base_name = _output_base_name(manifest_name, sbom_name)
+    output_dir = os.path.join(work_dir, runtime)
+    output_filename = f'{base_name}_{runtime}_analysis.json'
+    return AnalysisPaths(
+        manifest_name=manifest_name,
+        base_name=base_name,
+        work_dir=work_dir,
+        output_dir=output_dir,
+        output_filename=output_filename,
+        output_file_path=os.path.join(output_dir, output_filename)
+    )
+
+
+class _OutputTail:
+    """The most recent MAX_CAPTURED_BYTES (plus at most one read) of a child stream."""
+    
+    def __init__(self, max_bytes: int = MAX_CAPTURED_BYTES):
+        self.max_bytes = max_bytes
+        self.chunks = collections.deque()
+        self.size = 0
+    
+    def append(self, data: bytes):
+        self.chunks.append(data)
+        self.size += len(data)
+        while self.size - len(self.chunks[0]) >= self.max_bytes:
+            self.size -= len(self.chunks.popleft())
+    
+    def text(self) -> str:
+        # Chunks dropped from the tail are never decoded
+        return _decode(b''.join(self.chunks))
+
+
+def _drain_stream(stream, buffer: _OutputTail):
+    """Read a child pipe to EOF in fixed-size chunks, keeping only the tail."""
+    try:
+        for data in iter(partial(stream.read1, _DRAIN_CHUNK_BYTES), b''):
+            buffer.append(data)
+    except (OSError, ValueError):
+        pass  # pipe closed under us after a timeout
+    finally:
+        stream.close()
+
+
+def _kill_process_group(proc):
+    """Kill a child started with start_new_session=True together with everything it spawned."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+    except AttributeError:
+        proc.kill()  # no process groups on Windows
+
+
+def _run_bounded(cmd: List[str], cwd: str, env: Optional[Dict[str, str]], timeout: int) -> subprocess.CompletedProcess:
+    """subprocess.run equivalent whose captured stdout/stderr are capped at MAX_CAPTURED_BYTES each."""
+    # Own session, so a timeout also kills the pip/npm/mvn processes the analyzer started
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd, env=env,
+                            start_new_session=True)
+    stdout_buf, stderr_buf = _OutputTail(), _OutputTail()
+    drains = [threading.Thread(target=_drain_stream, args=(proc.stdout, stdout_buf), daemon=True),
+              threading.Thread(target=_drain_stream, args=(proc.stderr, stderr_buf), daemon=True)]
+    for drain in drains:
+        drain.start()
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_process_group(proc)
+        proc.wait()
+        raise
+    finally:
+        # Leftover background processes can keep the pipes open; never wait on them indefinitely
+        deadline = time.monotonic() + _DRAIN_JOIN_TIMEOUT
+        for drain in drains:
+            drain.join(max(0.0, deadline - time.monotonic()))
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout_buf.text(), stderr_buf.text())
+
+
+def _fast_copy(src: str, dst: str):
+    """Copy file contents as a reflink clone, else in-kernel with copy_file_range, else shutil.copyfile."""
+    if fcntl is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return
+        except OSError:
+            pass  # Filesystem without reflinks, or src/dst on different filesystems
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return
+        except OSError:
+            pass  # Unsupported by kernel or filesystem pair
+    shutil.copyfile(src, dst)
+
+
+@lru_cache(maxsize=64)
+def _parse_os_version(os_version: str) -> Tuple[str, str]:
+    """Parse an OS version string such as 'amazon-linux-2023' or 'ubuntu:22.04' into (name, version)."""
+    match = _OS_VERSION_RE.match(os_version)
+    if match:
+        return match.group('name').lower(), match.group('ver') or 'latest'
+    # Unknown OS names: "<name>:<version>", "<name>-<version>" or a bare name
+    if ':' in os_version:
+        os_name, os_ver = os_version.split(':', 1)
+    elif '-' in os_version:
+        os_name, os_ver = os_version.split('-', 1)
+    else:
+        os_name, os_ver = os_version, 'latest'
+    return os_name.lower(), os_ver
+
+
+@lru_cache(maxsize=None)
+def _script_name(runtime: str) -> str:
+    """Cached get_runtime_script_name."""
+    return get_runtime_script_name(runtime)
+
+
+@lru_cache(maxsize=None)
+def _exec_config(runtime: str) -> Dict:
+    """Cached get_runtime_execution_config; the returned dict is shared and must not be mutated."""
+    return get_runtime_execution_config(runtime)
+
+
+def _is_success(runtime: str, returncode: int) -> bool:
+    """Whether an analyzer exit code means success for this runtime (java also accepts 2 = some incompatible)."""
+    return returncode in _exec_config(runtime).get('success_codes', DEFAULT_SUCCESS_CODES)
+
+
+@lru_cache(maxsize=None)
+def _default_version(runtime: str) -> str:
+    """Cached get_runtime_default_version."""
+    return get_runtime_default_version(runtime)
+
+
+def _link_or_copy(src: str, dst: str):
+    """Hardlink src to dst, copying only when linking is impossible (cross-device, unsupported FS)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        _fast_copy(src, dst)
+
+
+def _is_stage_ignored(name: str) -> bool:
+    """Whether a tree entry matches STAGE_IGNORE_PATTERNS."""
+    return any(fnmatch.fnmatch(name, pattern) for pattern in STAGE_IGNORE_PATTERNS)
+
+
+def _stage_module(src: str, dst: str, link: bool = True):
+    """Mirror a directory tree into dst using hardlinks instead of byte copies, skipping ignored entries.
+    
+    With link=False (dst on another filesystem) files are copied directly instead of failing a link first.
+    DirEntry.is_dir/is_file answer from the d_type returned by getdents, so regular entries cost no stat.
+    """
+    # The parent always exists (work dir or the recursion's own mkdir), so skip makedirs' existence checks
+    try:
+        os.mkdir(dst)
+    except FileExistsError:
+        pass
+    with os.scandir(src) as entries:
+        for entry in entries:
+            if _is_stage_ignored(entry.name):
+                continue
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                _stage_module(entry.path, target, link)
+            elif entry.is_file():
+                if link:
+                    _link_or_copy(entry.path, target)
+                else:
+                    _fast_copy(entry.path, target)
+
+
+def _fast_rmtree(path: str):
+    """Remove a directory tree using os.scandir's cached d_type instead of a stat per entry."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _remove_temp_dir(temp_dir: str):
+    """Remove one temporary directory, logging instead of raising on failure."""
+    try:
+        logger.debug(f"Removing temporary directory: {temp_dir}")
+        _fast_rmtree(temp_dir)
+    except Exception as e:
+        logger.warning(f"Failed to remove temporary directory {temp_dir}: {e}")
+
+
+def _remove_temp_dirs(temp_dirs: List[str]):
+    """Remove temporary directories concurrently."""
+    if not temp_dirs:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(temp_dirs))) as executor:
+        list(executor.map(_remove_temp_dir, temp_dirs))
+
 
 class ExecutionEnvironment(ABC):
     """Base class for execution environments."""
@@ -50,16 +374,7 @@ class ExecutionEnvironment(ABC):
     @staticmethod
     def generate_output_filename(manifest_name: str, runtime: str, sbom_name: str = None) -> str:
         """Generate consistent output filename across all execution modes."""
-        if sbom_name:
-            base_name = sbom_name
-        else:
-            # Remove only the final extension (.json, .xml, etc.) not intermediate dots
-            if '.' in manifest_name:
-                base_name = manifest_name.rsplit('.', 1)[0]  # Remove only last .extension
-            else:
-                base_name = manifest_name
-        
-        return f'{base_name}_{runtime}_analysis.json'
+        return f'{_output_base_name(manifest_name, sbom_name)}_{runtime}_analysis.json'
 
 
 class NativeExecutionEnvironment(ExecutionEnvironment):
@@ -78,8 +393,8 @@ class NativeExecutionEnvironment(ExecutionEnvironment):
     def __init__(self):
         self.temp_dirs = []
     
-    def check_prerequisites(self, runtime: str) -> Tuple[bool, List[str]]:
-        """Check if native tools are available."""
+    def check_prerequisites(self, runtime: str, check_versions: bool = False) -> Tuple[bool, List[str]]:
+        """Check if native tools are available on PATH; run `<tool> --version` only when check_versions is set."""
         logger.debug(f"Checking prerequisites for {runtime} runtime")
         
         if runtime not in self.RUNTIME_PREREQUISITES:
@@ -89,19 +404,25 @@ class NativeExecutionEnvironment(ExecutionEnvironment):
         required_tools = self.RUNTIME_PREREQUISITES[runtime]
         logger.debug(f"Required tools for {runtime}: {required_tools}")
         
+        if check_versions:
+            # One fused fork for the common all-present case; results are memoized per process
+            fused_ok, fused_output = _probe_tools(tuple(required_tools))
+            if fused_ok:
+                probes = [(True, fused_output)] * len(required_tools)
+            else:
+                # Probe individually (concurrently, so timeouts overlap) to attribute the missing tool
+                with ThreadPoolExecutor(max_workers=len(required_tools)) as executor:
+                    probes = list(executor.map(_probe_tool, required_tools))
+        else:
+            # Pure PATH scan, no fork/exec
+            probes = [(path is not None, path or 'not found on PATH') for path in map(shutil.which, required_tools)]
+        
         missing_tools = []
-        for tool in required_tools:
-            try:
-                logger.debug(f"Checking availability of {tool}")
-                result = subprocess.run([tool, '--version'], 
-                                     capture_output=True, check=True, timeout=10)
-                if hasattr(result.stdout, 'decode'):
-                    logger.debug(f"{tool} is available: {result.stdout.decode()[:100]}...")
-                else:
-                    stdout_str = str(result.stdout)
-                    logger.debug(f"{tool} is available: {stdout_str[:100]}..." if len(stdout_str) > 100 else f"{tool} is available: {stdout_str}")
-            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-                logger.warning(f"{tool} is not available: {str(e)}")
+        for tool, (available, detail) in zip(required_tools, probes):
+            if available:
+                logger.debug(f"{tool} is available: {detail[:100]}")
+            else:
+                logger.warning(f"{tool} is not available: {detail}")
                 missing_tools.append(tool)
         
         success = len(missing_tools) == 0
@@ -109,91 +430,104 @@ class NativeExecutionEnvironment(ExecutionEnvironment):
         return success, missing_tools
 
     
-    def _setup_runtime_analysis(self, runtime: str, manifest_path: str, work_dir: str, **kwargs) -> Tuple[str, str, str]:
-        """Common setup for runtime analysis - returns (output_file_path, output_filename, manifest_name)."""
-        script_name = get_runtime_script_name(runtime)
-        tester_script = Path(__file__).parent / script_name
-        work_tester = Path(work_dir) / script_name
-        shutil.copy2(str(tester_script), str(work_tester))
-        
-        # Copy graviton_validator module
-        graviton_validator_dir = Path(__file__).parent.parent
-        work_graviton_validator = Path(work_dir) / 'graviton_validator'
-        shutil.copytree(str(graviton_validator_dir), str(work_graviton_validator))
-        logger.debug(f"Copied graviton_validator module to work directory")
+    def _setup_runtime_analysis(self, runtime: str, manifest_path: str, work_dir: str, **kwargs) -> AnalysisPaths:
+        """Common setup for runtime analysis - returns the analysis paths."""
+        script_name = _script_name(runtime)
+        _link_or_copy(str(_ANALYSIS_DIR / script_name), os.path.join(work_dir, script_name))
         
-        # Create output directory and file path using consistent filename generation
-        manifest_name = os.path.basename(manifest_path)
-        sbom_name = kwargs.get('sbom_name')
+        # Stage graviton_validator module
+        _stage_module(_MODULE_DIR_STR, os.path.join(work_dir, 'graviton_validator'),
+                      link=_same_device(work_dir, _MODULE_DIR_STR))
+        logger.debug(f"Staged graviton_validator module in work directory")
         
-        output_dir = os.path.join(work_dir, runtime)
-        os.makedirs(output_dir, exist_ok=True)
-        output_filename = self.generate_output_filename(manifest_name, runtime, sbom_name)
-        output_file_path = os.path.join(output_dir, output_filename)
+        # Create output directory using consistent filename generation
+        paths = _build_paths(runtime, manifest_path, work_dir, kwargs.get('sbom_name'))
+        os.makedirs(paths.output_dir, exist_ok=True)
         
-        return output_file_path, output_filename, manifest_name
+        return paths
     
-    def _handle_analysis_output(self, runtime: str, result: subprocess.CompletedProcess, output_file_path: str, output_filename: str, **kwargs) -> str:
-        """Common output handling for runtime analysis - returns file content."""
-        if os.path.exists(output_file_path):
-            try:
+    @staticmethod
+    def _wants_output_content(**kwargs) -> bool:
+        """Callers passing output_dir and sbom_name load results from the permanent copy, not result['output']."""
+        return kwargs.get('want_content', not (kwargs.get('output_dir') and kwargs.get('sbom_name')))
+    
+    def _handle_analysis_output(self, runtime: str, result: subprocess.CompletedProcess, paths: AnalysisPaths,
+                                want_content: bool = True, **kwargs) -> Tuple[Optional[str], str]:
+        """Common output handling for runtime analysis - returns (file content or None, final output path)."""
+        output_file_path = paths.output_file_path
+        if not os.path.exists(output_file_path):
+            logger.warning(f"NATIVE FILE MODE: {runtime} output file not found: {output_file_path}, using stdout")
+            return result.stdout, output_file_path
+        
+        permanent_output_dir = kwargs.get('output_dir')
+        try:
+            file_output = None
+            if want_content or not permanent_output_dir:
                 with open(output_file_path, 'r') as f:
                     file_output = f.read()
                 logger.debug(f"NATIVE FILE MODE: Successfully read {runtime} output file: {output_file_path} ({len(file_output)} chars)")
-                
-                # Copy to permanent output directory if provided
-                permanent_output_dir = kwargs.get('output_dir')
-                if permanent_output_dir:
-                    permanent_runtime_dir = os.path.join(permanent_output_dir, runtime)
-                    os.makedirs(permanent_runtime_dir, exist_ok=True)
-                    permanent_output_path = os.path.join(permanent_runtime_dir, output_filename)
-                    shutil.copy2(output_file_path, permanent_output_path)
-                    logger.debug(f"NATIVE FILE MODE: Copied {runtime} output file to: {permanent_output_path}")
-                
-                return file_output
-            except Exception as e:
-                logger.warning(f"NATIVE FILE MODE: Failed to read {runtime} output file {output_file_path}: {e}")
-                return result.stdout
-        else:
-            logger.warning(f"NATIVE FILE MODE: {runtime} output file not found: {output_file_path}, using stdout")
-            return result.stdout
+            
+            # Hand the file over to the permanent output directory if provided
+            if permanent_output_dir:
+                permanent_runtime_dir = os.path.join(permanent_output_dir, runtime)
+                os.makedirs(permanent_runtime_dir, exist_ok=True)
+                permanent_output_path = os.path.join(permanent_runtime_dir, paths.output_filename)
+                if file_output is None:
+                    # Nobody consumes the content here; move it (a rename on the same filesystem)
+                    shutil.move(output_file_path, permanent_output_path)
+                    logger.debug(f"NATIVE FILE MODE: Moved {runtime} output file to: {permanent_output_path}")
+                    return None, permanent_output_path
+                _fast_copy(output_file_path, permanent_output_path)
+                logger.debug(f"NATIVE FILE MODE: Copied {runtime} output file to: {permanent_output_path}")
+            
+            return file_output, output_file_path
+        except Exception as e:
+            logger.warning(f"NATIVE FILE MODE: Failed to read {runtime} output file {output_file_path}: {e}")
+            return result.stdout, output_file_path
+    
+    def _prepare_work_dir(self, runtime: str, manifest_path: str) -> str:
+        """Create an isolated temporary directory holding a copy of the manifest - returns the copied manifest path."""
+        temp_dir = tempfile.mkdtemp(prefix=f'graviton_{runtime}_')
+        self.temp_dirs.append(temp_dir)
+        logger.debug(f"Created temporary directory: {temp_dir}")
+        
+        manifest_name = os.path.basename(manifest_path)
+        temp_manifest = os.path.join(temp_dir, manifest_name)
+        logger.debug(f"Copying manifest {manifest_path} to {temp_manifest}")
+        _fast_copy(manifest_path, temp_manifest)
+        logger.debug(f"Manifest copied successfully")
+        
+        return temp_manifest
+    
+    def _log_analysis_result(self, runtime: str, result: Dict):
+        """Log the outcome of a native runtime analysis."""
+        logger.info(f"Native {runtime} analysis completed - Success: {result.get('success', False)}")
+        # Only log stderr as error if the process actually failed
+        if result.get('error') and not result.get('success', False):
+            logger.error(f"Native {runtime} analysis error: {result['error']}")
+        elif result.get('stderr') and result.get('success', False):
+            # Process succeeded but had stderr output - log as debug
+            logger.debug(f"Native {runtime} analysis stderr (process succeeded): {result['stderr']}")
     
     def execute_analysis(self, runtime: str, manifest_path: str, **kwargs) -> Dict:
         """Execute analysis using native tools with isolation."""
         logger.info(f"Starting native execution analysis for {runtime}")
         logger.debug(f"Manifest path: {manifest_path}")
-        logger.debug(f"Execution kwargs: {list(kwargs.keys())}")
-        
-        # Create isolated temporary directory
-        temp_dir = tempfile.mkdtemp(prefix=f'graviton_{runtime}_')
-        self.temp_dirs.append(temp_dir)
-        logger.debug(f"Created temporary directory: {temp_dir}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Execution kwargs: {list(kwargs)}")
         
         try:
-            # Copy manifest to temp directory
-            manifest_name = os.path.basename(manifest_path)
-            temp_manifest = os.path.join(temp_dir, manifest_name)
-            logger.debug(f"Copying manifest {manifest_path} to {temp_manifest}")
-            shutil.copy2(manifest_path, temp_manifest)
-            logger.debug(f"Manifest copied successfully")
-            
             # Execute runtime-specific analysis
             logger.debug(f"Executing {runtime}-specific analysis")
-            config = get_runtime_execution_config(runtime)
+            config = _exec_config(runtime)
             if config:
-                result = self._execute_runtime_analysis(runtime, temp_manifest, temp_dir, **kwargs)
+                temp_manifest = self._prepare_work_dir(runtime, manifest_path)
+                result = self._execute_runtime_analysis(runtime, temp_manifest, os.path.dirname(temp_manifest), config=config, **kwargs)
             else:
                 logger.error(f"Unsupported runtime: {runtime}")
                 result = {'error': f'Unsupported runtime: {runtime}'}
             
-            logger.info(f"Native {runtime} analysis completed - Success: {result.get('success', False)}")
-            # Only log stderr as error if the process actually failed
-            if result.get('error') and not result.get('success', False):
-                logger.error(f"Native {runtime} analysis error: {result['error']}")
-            elif result.get('stderr') and result.get('success', False):
-                # Process succeeded but had stderr output - log as debug
-                logger.debug(f"Native {runtime} analysis stderr (process succeeded): {result['stderr']}")
-            
+            self._log_analysis_result(runtime, result)
             return result
                 
         except Exception as e:
@@ -201,72 +535,90 @@ class NativeExecutionEnvironment(ExecutionEnvironment):
             logger.exception(f"Full traceback for native {runtime} execution error:")
             return {'error': f'Analysis execution failed: {str(e)}'}
     
-    def _execute_runtime_analysis(self, runtime: str, manifest_path: str, work_dir: str, **kwargs) -> Dict:
+    def _build_runtime_command(self, runtime: str, paths: AnalysisPaths, **kwargs) -> Tuple[List[str], Optional[Dict[str, str]]]:
+        """Build the analyzer command line and environment - returns (cmd, env); env is None to inherit unchanged."""
+        script_name = _script_name(runtime)
+        cmd = ['python3', script_name, paths.manifest_name]
+        
+        # Add runtime-specific flags
+        if runtime == 'java':
+            if kwargs.get('deep_scan', False):
+                cmd.append('--deep-scan')
+            if kwargs.get('runtime_test', False):
+                cmd.append('--runtime-test')
+            if kwargs.get('verbose', False):
+                cmd.append('--verbose')
+        
+        cmd.extend(['-o', paths.output_file_path])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"NATIVE FILE MODE: Executing {runtime} command: {' '.join(cmd)}")
+        
+        # Only copy the environment when something is added; None makes the child inherit it as-is
+        overrides = self._runtime_env_overrides(runtime, **kwargs)
+        env = None
+        if overrides:
+            env = os.environ.copy()
+            env.update(overrides)
+        
+        return cmd, env
+    
+    @staticmethod
+    def _runtime_env_overrides(runtime: str, **kwargs) -> Dict[str, str]:
+        """Environment variables the analyzer needs on top of the inherited environment."""
+        if not kwargs.get('verbose', False):
+            return {}
+        if runtime == 'nodejs':
+            return {'NODE_LOG_LEVEL': 'DEBUG'}
+        return {'DEBUG': '1'}
+    
+    def _build_runtime_result(self, runtime: str, config: Dict, cmd: List[str], result: subprocess.CompletedProcess,
+                              execution_time: float, paths: AnalysisPaths, **kwargs) -> Dict:
+        """Turn a finished analyzer process into the result dictionary."""
+        runtime_version = kwargs.get('runtime_version', config.get('default_version', _default_version(runtime)))
+        logger.debug(f"{runtime} command completed - Return code: {result.returncode}, Execution time: {execution_time}s")
+        
+        # Determine success based on runtime-specific exit codes
+        success = _is_success(runtime, result.returncode)
+        
+        # Common output handling
+        kwargs['want_content'] = self._wants_output_content(**kwargs)
+        file_output, output_file_path = self._handle_analysis_output(runtime, result, paths, **kwargs)
+        
+        # Build environment string
+        if runtime == 'dotnet' and runtime_version:
+            env_str = f'native_dotnet_{runtime_version}'
+        elif runtime == 'dotnet':
+            env_str = 'native_dotnet'
+        else:
+            env_str = f'{runtime}_{runtime_version}'
+        
+        return {
+            'success': success,
+            'output': file_output,
+            'error': result.stderr if not success else None,
+            'stderr': result.stderr,
+            'environment': env_str,
+            'command': ' '.join(cmd),
+            'work_dir': paths.work_dir,
+            'execution_time': execution_time,
+            'output_file_path': output_file_path
+        }
+    
+    def _execute_runtime_analysis(self, runtime: str, manifest_path: str, work_dir: str, config: Dict = None, **kwargs) -> Dict:
         """Execute runtime dependency analysis using unified approach."""
-        config = get_runtime_execution_config(runtime)
-        runtime_version = kwargs.get('runtime_version', config.get('default_version', get_runtime_default_version(runtime)))
+        config = config or _exec_config(runtime)
         
         try:
             # Common setup
-            output_file_path, output_filename, manifest_name = self._setup_runtime_analysis(runtime, manifest_path, work_dir, **kwargs)
-            
-            # Build command
-            script_name = get_runtime_script_name(runtime)
-            cmd = ['python3', script_name, manifest_name]
-            
-            # Add runtime-specific flags
-            if runtime == 'java':
-                if kwargs.get('deep_scan', False):
-                    cmd.append('--deep-scan')
-                if kwargs.get('runtime_test', False):
-                    cmd.append('--runtime-test')
-                if kwargs.get('verbose', False):
-                    cmd.append('--verbose')
-            
-            cmd.extend(['-o', output_file_path])
-            logger.debug(f"NATIVE FILE MODE: Executing {runtime} command: {' '.join(cmd)}")
-            
-            # Set environment variables
-            env = os.environ.copy()
-            if kwargs.get('verbose', False):
-                if runtime == 'nodejs':
-                    env['NODE_LOG_LEVEL'] = 'DEBUG'
-                else:
-                    env['DEBUG'] = '1'
+            paths = self._setup_runtime_analysis(runtime, manifest_path, work_dir, **kwargs)
+            cmd, env = self._build_runtime_command(runtime, paths, **kwargs)
             
             # Execute with runtime-specific timeout
             start_time = time.time()
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=work_dir, timeout=config['timeout'], env=env)
+            result = _run_bounded(cmd, work_dir, env, config['timeout'])
             execution_time = round(time.time() - start_time, 2)
             
-            logger.debug(f"{runtime} command completed - Return code: {result.returncode}, Execution time: {execution_time}s")
-            
-            # Determine success based on runtime-specific exit codes
-            success_codes = config.get('success_codes', [0])
-            success = result.returncode in success_codes
-            
-            # Common output handling
-            file_output = self._handle_analysis_output(runtime, result, output_file_path, output_filename, **kwargs)
-            
-            # Build environment string
-            if runtime == 'dotnet' and runtime_version:
-                env_str = f'native_dotnet_{runtime_version}'
-            elif runtime == 'dotnet':
-                env_str = 'native_dotnet'
-            else:
-                env_str = f'{runtime}_{runtime_version}'
-            
-            return {
-                'success': success,
-                'output': file_output,
-                'error': result.stderr if not success else None,
-                'stderr': result.stderr,
-                'environment': env_str,
-                'command': ' '.join(cmd),
-                'work_dir': work_dir,
-                'execution_time': execution_time,
-                'output_file_path': output_file_path
-            }
+            return self._build_runtime_result(runtime, config, cmd, result, execution_time, paths, **kwargs)
             
         except subprocess.TimeoutExpired:
             return {'error': f'{runtime} analysis timed out after {config["timeout"]} seconds'}
@@ -285,12 +637,7 @@ class NativeExecutionEnvironment(ExecutionEnvironment):
             
         logger.debug(f"Cleaning up {len(self.temp_dirs)} temporary directories")
         
-        for temp_dir in self.temp_dirs:
-            try:
-                logger.debug(f"Removing temporary directory: {temp_dir}")
-                shutil.rmtree(temp_dir)
-            except Exception as e:
-                logger.warning(f"Failed to remove temporary directory {temp_dir}: {e}")
+        _remove_temp_dirs(self.temp_dirs)
         
         self.temp_dirs.clear()
         logger.debug("Temporary directory cleanup completed")
@@ -301,10 +648,109 @@ class ContainerExecutionEnvironment(ExecutionEnvironment):
     
 
     
-    def __init__(self):
+    # Python dependencies of the package installer scripts, installed in every analysis image
+    PIP_DEPS_COMMON = ('PyYAML', 'defusedxml', 'packaging', 'psutil', 'openpyxl')
+    PIP_DEPS_PINNED = PIP_DEPS_COMMON + ("'urllib3<2.0'",)
+    PIP_DEPS_JAVA = PIP_DEPS_COMMON + ("'requests<2.29'", "'urllib3<2.0'")
+    
+    # BuildKit cache mounts: package downloads persist across builds but never land in an image layer
+    APT_CACHE_DIRS = ('/var/cache/apt', '/var/lib/apt')
+    YUM_CACHE_DIRS = ('/var/cache/yum', '/var/cache/dnf')
+    PIP_CACHE_DIR = '/root/.cache/pip'
+    # Debian/Ubuntu images delete downloaded .debs after install; keep them in the cache mount
+    APT_KEEP_CACHE = 'rm -f /etc/apt/apt.conf.d/docker-clean'
+    # Dockerfile frontend supporting RUN --mount (ignored as a comment by Podman/Buildah, which support it natively)
+    DOCKERFILE_SYNTAX = '# syntax=docker/dockerfile:1.4'
+    # Fail-fast, traced shells for the toolchain RUN: bash (with pipefail) on the distro bases,
+    # POSIX sh on the Alpine and .NET SDK bases where bash is not guaranteed before the install
+    BASH_SHELL = 'SHELL ["/bin/bash", "-euxo", "pipefail", "-c"]'
+    POSIX_SHELL = 'SHELL ["/bin/sh", "-eux", "-c"]'
+    # Layout shared by every generated Dockerfile; shell, run and env carry their own trailing newlines
+    DOCKERFILE_TEMPLATE = "{syntax}\nFROM {base}\n{shell}{run}{env}WORKDIR /workspace"
+    
+    # Analysis image recipe per runtime. Ruby, Node.js and .NET use their own base images; Python and
+    # Java use the detected OS (or the Alpine image when the OS is alpine).
+    # Single-stage on purpose: compilers/headers are needed at analysis time, when the installers
+    # build the user's native packages (pip sdists, node-gyp addons, native gems), so a
+    # builder/runtime split could not drop them from the final image.
+    RUNTIME_SPECS = {
+        'python': RuntimeSpec(
+            recipes={
+                'rpm': ToolchainRecipe(('bash', 'python3', 'python3-pip', 'gcc', 'gcc-c++', 'python3-devel', 'make'),
+                                       PIP_DEPS_COMMON),
+                'deb': ToolchainRecipe(('bash', 'python3', 'python3-pip', 'gcc', 'g++', 'python3-dev', 'build-essential'),
+                                       PIP_DEPS_PINNED),
+                # Official Python Alpine image; headers are bundled, so only the compiler toolchain is added
+                'apk': ToolchainRecipe(('bash', 'gcc', 'g++', 'make', 'musl-dev', 'linux-headers', 'libffi-dev', 'openssl-dev'),
+                                       PIP_DEPS_PINNED),
+            },
+            alpine_base_image='python:{version}-alpine',
+            default_version='3.11'
+        ),
+        # Official Node.js Alpine image avoids GLIBC compatibility issues
+        'nodejs': RuntimeSpec(
+            recipes={
+                'apk': ToolchainRecipe(('bash', 'gcc', 'g++', 'make', 'musl-dev', 'python3-dev', 'python3', 'py3-pip',
+                                        'linux-headers', 'libffi-dev', 'openssl-dev', 'curl'),
+                                       PIP_DEPS_PINNED, '--break-system-packages'),
+            },
+            base_image='node:{version}-alpine',
+            base_family='apk',
+            default_version='20'
+        ),
+        # Official Microsoft .NET SDK image (Debian-based)
+        'dotnet': RuntimeSpec(
+            recipes={
+                'deb': ToolchainRecipe(('bash', 'python3', 'python3-pip'), PIP_DEPS_PINNED, '--break-system-packages'),
+            },
+            base_image='mcr.microsoft.com/dotnet/sdk:{version}',
+            base_family='deb',
+            default_version='8.0',
+            env=('DOTNET_CLI_TELEMETRY_OPTOUT=1', 'DOTNET_SKIP_FIRST_TIME_EXPERIENCE=1')
+        ),
+        # Alpine Ruby image for faster builds and specific Ruby versions
+        'ruby': RuntimeSpec(
+            recipes={
+                'apk': ToolchainRecipe(('bash', 'gcc', 'g++', 'make', 'musl-dev', 'python3-dev', 'python3', 'py3-pip',
+                                        'linux-headers', 'libffi-dev', 'openssl-dev', 'curl'),
+                                       PIP_DEPS_PINNED, '--break-system-packages'),
+            },
+            base_image='ruby:{version}-alpine',
+            base_family='apk',
+            default_version='3.2',
+            extra_commands=('gem install bundler',)
+        ),
+        'java': RuntimeSpec(
+            recipes={
+                'rpm': ToolchainRecipe(('bash', 'java-{version}-amazon-corretto-devel', 'maven', 'python3', 'python3-pip'),
+                                       PIP_DEPS_JAVA),
+                'deb': ToolchainRecipe(('bash', 'openjdk-{version}-jdk', 'maven', 'python3', 'python3-pip'),
+                                       PIP_DEPS_JAVA),
+                # Eclipse Temurin JDK on Alpine; the C toolchain is only for building psutil against musl
+                'apk': ToolchainRecipe(('bash', 'maven', 'python3', 'py3-pip', 'gcc', 'musl-dev', 'python3-dev', 'linux-headers'),
+                                       PIP_DEPS_JAVA, '--break-system-packages'),
+            },
+            alpine_base_image='eclipse-temurin:{version}-jdk-alpine',
+            default_version='17'
+        ),
+    }
+    
+    # Container paths for the shared analyses directory and the read-only project tree
+    ANALYSES_ROOT = '/analyses'
+    PROJECT_ROOT = '/workspace'
+    
+    def __init__(self, persist_images: bool = False):
+        # Opt-in: keep built toolchain images so later runs skip the build. Nothing evicts them, and the
+        # tag hashes only the Dockerfile text, so a kept image also pins whatever the base image tag and
+        # package updates resolved to when it was built; remove graviton-*-analysis images to refresh
+        self.persist_images = persist_images
+        self.persistent_images = set()  # built this run but deliberately left in the local image store
         self.created_images = []
         self.temp_dirs = []
         self.container_tool = 'docker'  # Default, will be detected
+        self._image_specs = {}  # (runtime, runtime_version, os_version) -> (Dockerfile, image name)
+        self._ready_images = set()  # images known to exist, built or found during this run
+        self._workspace_root = None
     
     def check_prerequisites(self, runtime: str) -> Tuple[bool, List[str]]:
         """Check if Docker or Podman is available."""
@@ -316,20 +762,17 @@ class ContainerExecutionEnvironment(ExecutionEnvironment):
     
     def _detect_container_tool(self) -> str:
         """Detect available container tool."""
-        for tool in ['docker', 'podman']:
-            try:
-                subprocess.run([tool, '--version'], 
-                             capture_output=True, check=True, timeout=10)
+        for tool in ('docker', 'podman'):
+            if shutil.which(tool):
                 return tool
-            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-                continue
         return None
     
     def execute_analysis(self, runtime: str, manifest_path: str, **kwargs) -> Dict:
         """Execute analysis in Docker container with dynamic OS-based construction."""
         logger.info(f"Starting container execution analysis for {runtime}")
         logger.debug(f"Container manifest path: {manifest_path}")
-        logger.debug(f"Container execution kwargs: {list(kwargs.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Container execution kwargs: {list(kwargs)}")
         logger.debug(f"DEBUG FILE COPY: output_dir in kwargs = {kwargs.get('output_dir')}")
         logger.debug(f"DEBUG FILE COPY: sbom_name in kwargs = {kwargs.get('sbom_name')}")
         
@@ -337,212 +780,179 @@ class ContainerExecutionEnvironment(ExecutionEnvironment):
         logger.info(f"Using {self.container_tool} for container operations")
         
         try:
-            runtime_version = kwargs.get('runtime_version', get_runtime_default_version(runtime))
+            runtime_version = kwargs.get('runtime_version', _default_version(runtime))
             os_version = kwargs.get('os_version', 'amazon-linux-2023')
             logger.info(f"Container config - Runtime: {runtime} {runtime_version}, OS: {os_version}")
             
-            # Create temporary directory for Docker context
-            temp_dir = tempfile.mkdtemp(prefix=f'graviton_docker_{runtime}_')
-            self.temp_dirs.append(temp_dir)
-            logger.debug(f"Created Docker context directory: {temp_dir}")
+            # Create the analysis directory under the root mounted into the analysis containers;
+            # the build context is a subdirectory holding only the Dockerfile
+            temp_dir = tempfile.mkdtemp(prefix=f'graviton_docker_{runtime}_', dir=self._get_workspace_root())
+            build_dir = os.path.join(temp_dir, '.docker-build')
+            logger.debug(f"Created Docker workspace directory: {temp_dir}")
             
-            # Generate Dockerfile with detected OS
-            logger.debug(f"Generating Dockerfile for {runtime} with OS {os_version}")
-            dockerfile_content = self._generate_dockerfile(runtime, runtime_version, os_version)
-            dockerfile_path = os.path.join(temp_dir, 'Dockerfile')
-            logger.debug(f"Dockerfile content ({len(dockerfile_content)} chars): {dockerfile_content[:200]}...")
+            # Dockerfile and content-addressed image tag, generated once per (runtime, version, OS)
+            dockerfile_content, image_name = self._get_image_spec(runtime, runtime_version, os_version)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Dockerfile content ({len(dockerfile_content)} chars): {dockerfile_content[:200]}...")
             
-            with open(dockerfile_path, 'w') as f:
-                f.write(dockerfile_content)
-            logger.debug(f"Dockerfile written to: {dockerfile_path}")
+            # The manifest and project tree are bind-mounted read-only into the container at run time
+            paths = _build_paths(runtime, manifest_path, temp_dir, kwargs.get('sbom_name'))
             
-            # Copy manifest to Docker context
-            manifest_name = os.path.basename(manifest_path)
-            temp_manifest = os.path.join(temp_dir, manifest_name)
-            logger.debug(f"Copying manifest {manifest_path} to Docker context as {manifest_name}")
-            shutil.copy2(manifest_path, temp_manifest)
+            # Log manifest contents for debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    with open(manifest_path, 'r') as f:
+                        manifest_content = f.read()
+                        logger.debug(f"MANIFEST FILE ({paths.manifest_name}, {len(manifest_content)} chars):\n{manifest_content}")
+                except Exception as e:
+                    logger.warning(f"Could not read manifest content for logging: {e}")
             
-            # Also copy with standard name for runtime compatibility
-            if runtime == 'nodejs' and not manifest_name == 'package.json':
-                standard_manifest = os.path.join(temp_dir, 'package.json')
-                shutil.copy2(manifest_path, standard_manifest)
-                logger.debug(f"Also copied manifest as package.json for Node.js compatibility")
+            # Images built (or found) earlier in this run are reused without asking the engine again
+            reuse_image = image_name in self._ready_images or self._image_exists(image_name)
+            if reuse_image:
+                logger.info(f"Reusing existing {self.container_tool} image: {image_name}")
+            else:
+                if self.persist_images:
+                    self.persistent_images.add(image_name)
+                elif image_name not in self.created_images:
+                    self.created_images.append(image_name)
+                logger.info(f"Building Docker image: {image_name}")
+                # Only a build needs the Dockerfile on disk
+                os.makedirs(build_dir)
+                dockerfile_path = os.path.join(build_dir, 'Dockerfile')
+                with open(dockerfile_path, 'w') as f:
+                    f.write(dockerfile_content)
+                logger.debug(f"Dockerfile written to: {dockerfile_path}")
             
-            # Copy graviton_validator.py and entire module to Docker context
-            self._copy_graviton_validator_module(temp_dir)
+            build_cmd = [self.container_tool, 'build', '-t', image_name, '.']
+            if self.container_tool == 'podman':
+                # Buildah's default OCI format drops the SHELL instruction; the docker format honours it
+                build_cmd[2:2] = ['--format', 'docker']
+                if os.environ.get('GRAVITON_PODMAN_SQUASH', '1') != '0':
+                    # Squash only the new layers; base image layers stay shared between runtime images
+                    build_cmd[2:2] = ['--squash']
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"MANUAL TEST COMMAND: cd {build_dir} && {' '.join(build_cmd)}")
+                logger.debug(f"TEMP DIR PRESERVED FOR DEBUGGING: {temp_dir}")
+                logger.debug(f"{self.container_tool.title()} build command: {' '.join(build_cmd)}")
+                logger.debug(f"{self.container_tool.title()} build context: {build_dir}")
             
-            # Copy standalone tester script to Docker context (for backward compatibility)
-            self._copy_standalone_tester(runtime, temp_dir)
+                # Log all files for debugging and replication
+                logger.debug(f"=== DEBUG INFO FOR {runtime.upper()} ANALYSIS ===")
+                logger.debug(f"Temp directory: {temp_dir}")
+                logger.debug(f"Analysis directory in container: {self._container_workdir(temp_dir)}")
             
-            # Log manifest contents for debugging
-            try:
-                with open(temp_manifest, 'r') as f:
-                    manifest_content = f.read()
-                    logger.debug(f"Container manifest content ({len(manifest_content)} chars): {manifest_content[:300]}...")
-            except Exception as e:
-                logger.warning(f"Could not read manifest content for logging: {e}")
-            
-            # Build Docker image with OS info
-            os_tag = os_version.replace(':', '-').replace('.', '-')
-            image_name = f'graviton-{runtime}-analysis:{runtime_version}-{os_tag}'
-            self.created_images.append(image_name)
-            logger.info(f"Building Docker image: {image_name}")
+                # Log Dockerfile (manifest content was logged above)
+                logger.debug(f"DOCKERFILE:\n{dockerfile_content}")
+                
+                # Log expected output path
+                logger.debug(f"EXPECTED OUTPUT FILE: {paths.output_file_path}")
             
-            build_cmd = [self.container_tool, 'build', '-t', image_name, '.']
-            logger.debug(f"MANUAL TEST COMMAND: cd {temp_dir} && {' '.join(build_cmd)}")
-            logger.debug(f"TEMP DIR PRESERVED FOR DEBUGGING: {temp_dir}")
-            logger.debug(f"{self.container_tool.title()} build command: {' '.join(build_cmd)}")
-            logger.debug(f"{self.container_tool.title()} build context: {temp_dir}")
-            
-            # Log all files for debugging and replication
-            logger.debug(f"=== DEBUG INFO FOR {runtime.upper()} ANALYSIS ===")
-            logger.debug(f"Temp directory: {temp_dir}")
-            logger.debug(f"Volume mount: {temp_dir}:/workspace")
-            
-            # Log Dockerfile
-            try:
-                with open(os.path.join(temp_dir, 'Dockerfile'), 'r') as f:
-                    dockerfile_content = f.read()
-                    logger.debug(f"DOCKERFILE:\n{dockerfile_content}")
-            except Exception as e:
-                logger.warning(f"Could not read Dockerfile: {e}")
-            
-            # Log manifest file
-            try:
-                with open(temp_manifest, 'r') as f:
-                    manifest_content = f.read()
-                    logger.debug(f"MANIFEST FILE ({manifest_name}):\n{manifest_content}")
-            except Exception as e:
-                logger.warning(f"Could not read manifest: {e}")
-            
-            # Log expected output path
-            sbom_name = kwargs.get('sbom_name')
-            if sbom_name:
-                expected_base = sbom_name
+            if reuse_image:
+                build_result = subprocess.CompletedProcess(build_cmd, 0, b'', b'')
             else:
-                expected_base = manifest_name.rsplit('.', 1)[0] if '.' in manifest_name else manifest_name
-            expected_output = f"{temp_dir}/{runtime}/{expected_base}_{runtime}_analysis.json"
-            logger.debug(f"EXPECTED OUTPUT FILE: {expected_output}")
-            
-
-            
-            build_result = subprocess.run(
-                build_cmd, capture_output=True, text=True, cwd=temp_dir, timeout=300
-            )
+                build_result = subprocess.run(
+                    build_cmd, capture_output=True, cwd=build_dir, env=self._build_env(), timeout=300
+                )
             
             logger.debug(f"{self.container_tool.title()} build completed - Return code: {build_result.returncode}")
-            if build_result.stdout:
-                logger.debug(f"{self.container_tool.title()} build stdout ({len(build_result.stdout)} chars): {build_result.stdout[:500]}...")
-            if build_result.stderr:
-                logger.debug(f"{self.container_tool.title()} build stderr ({len(build_result.stderr)} chars): {build_result.stderr[:500]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                if build_result.stdout:
+                    logger.debug(f"{self.container_tool.title()} build stdout ({len(build_result.stdout)} bytes): {_decode(build_result.stdout, 500)}...")
+                if build_result.stderr:
+                    logger.debug(f"{self.container_tool.title()} build stderr ({len(build_result.stderr)} bytes): {_decode(build_result.stderr, 500)}...")
             
             if build_result.returncode != 0:
-                logger.error(f"{self.container_tool.title()} build failed for {runtime}: {build_result.stderr[:200]}...")
+                logger.error(f"{self.container_tool.title()} build failed for {runtime}: {_decode(build_result.stderr, 200)}...")
                 return {
                     'success': False,
-                    'error': f'{self.container_tool.title()} build failed: {build_result.stderr}',
+                    'error': f'{self.container_tool.title()} build failed: {_decode(build_result.stderr)}',
                     'environment': f'container_{runtime}_{runtime_version}'
                 }
             
-            logger.info(f"{self.container_tool.title()} image built successfully: {image_name}")
+            if not reuse_image:
+                logger.info(f"{self.container_tool.title()} image built successfully: {image_name}")
+            self._ready_images.add(image_name)
             
-            # Run analysis in container with same structure as native execution
-            sbom_name = kwargs.get('sbom_name')
-            analysis_cmd = self._get_analysis_command(runtime, manifest_name, sbom_name)
+            # Run analysis with same structure as native execution
+            analysis_cmd = self._get_analysis_command(runtime, paths)
             container_run_cmd = [
                 self.container_tool, 'run', '--rm',
-                '-v', f'{temp_dir}:/workspace',
-                '-w', '/workspace',
+                *self._get_container_mounts(),
+                *self._get_manifest_mounts(runtime, manifest_path, paths),
+                '-w', self._container_workdir(temp_dir),
                 image_name,
                 'sh', '-c', analysis_cmd
             ]
             
             logger.info(f"Running {runtime} analysis in container")
-            logger.debug(f"BUILD COMMAND: cd {temp_dir} && {' '.join(build_cmd)}")
-            logger.debug(f"RUN COMMAND: {' '.join(container_run_cmd)}")
-            logger.debug(f"ANALYSIS COMMAND INSIDE CONTAINER: {analysis_cmd}")
-            logger.debug(f"DEBUG FILE COPY: Manifest name passed to container = {manifest_name}")
-            logger.debug(f"DEBUG FILE COPY: Expected container output filename = {manifest_name.rsplit('.', 1)[0] if '.' in manifest_name else manifest_name}_{runtime}_analysis.json")
-            logger.debug(f"{self.container_tool.title()} run command: {' '.join(container_run_cmd)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"BUILD COMMAND: cd {build_dir} && {' '.join(build_cmd)}")
+                logger.debug(f"RUN COMMAND: {' '.join(container_run_cmd)}")
+                logger.debug(f"ANALYSIS COMMAND INSIDE CONTAINER: {analysis_cmd}")
+                logger.debug(f"DEBUG FILE COPY: Manifest name passed to container = {paths.manifest_name}")
+                logger.debug(f"DEBUG FILE COPY: Expected container output filename = {paths.output_filename}")
+                logger.debug(f"{self.container_tool.title()} run command: {' '.join(container_run_cmd)}")
+                logger.debug(f"=== END DEBUG INFO ===")
 
-            logger.debug(f"=== END DEBUG INFO ===")
-            
             run_result = subprocess.run(
-                container_run_cmd, capture_output=True, text=True, timeout=180
+                container_run_cmd, capture_output=True, timeout=180
             )
             
             logger.debug(f"Container analysis completed - Return code: {run_result.returncode}")
-            logger.debug(f"Container stdout ({len(run_result.stdout)} chars): {run_result.stdout[:500]}...")
-            logger.debug(f"Container stderr ({len(run_result.stderr)} chars): {run_result.stderr[:500]}...")
-            
-            # Check if output directory was created
-            output_dir = os.path.join(temp_dir, runtime)
-            if os.path.exists(output_dir):
-                output_files = os.listdir(output_dir)
-                logger.debug(f"Output directory contains {len(output_files)} files: {output_files}")
-            else:
-                logger.warning(f"Output directory not found: {output_dir}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Container stdout ({len(run_result.stdout)} bytes): {_decode(run_result.stdout, 500)}...")
+                logger.debug(f"Container stderr ({len(run_result.stderr)} bytes): {_decode(run_result.stderr, 500)}...")
             
-            # Handle runtime-specific exit codes
-            if runtime == 'java':
-                # Java package installer exit codes: 0=all compatible, 1=error, 2=some incompatible
-                success = run_result.returncode in [0, 2]
+            # Scan the output directory once: existence, listing and output file lookup in a single pass
+            output_entries = self._scan_output_dir(paths.output_dir)
+            if output_entries is None:
+                logger.warning(f"Output directory not found: {paths.output_dir}")
+                output_entries = []
             else:
-                success = run_result.returncode == 0
+                logger.debug(f"Output directory contains {len(output_entries)} files: {[e.name for e in output_entries]}")
+            
+            # Same runtime-specific exit code semantics as native mode
+            success = _is_success(runtime, run_result.returncode)
             
             environment = f'container_{runtime}_{runtime_version}_{os_version.replace(":", "-")}'
             
             if success:
                 logger.info(f"Container {runtime} analysis: SUCCESS")
             else:
-                logger.error(f"Container {runtime} analysis: FAILED - {run_result.stderr[:200]}...")
+                logger.error(f"Container {runtime} analysis: FAILED - {_decode(run_result.stderr, 200)}...")
                 # Log error but continue execution
                 logger.warning(f"Container {runtime} analysis failed, returning error result")
             
             # Read output file from mounted volume - match native mode structure
-            # Use same filename logic as _get_analysis_command to ensure consistency
-            sbom_name = kwargs.get('sbom_name')
-            if sbom_name:
-                base_name = sbom_name
-            else:
-                if '.' in manifest_name:
-                    base_name = manifest_name.rsplit('.', 1)[0]  # Remove only last .extension
-                else:
-                    base_name = manifest_name
-            
-            output_filename = f'{base_name}_{runtime}_analysis.json'
-            output_file_path = os.path.join(temp_dir, runtime, output_filename)
+            # Paths come from the same _build_paths used by _get_analysis_command to ensure consistency
+            output_filename = paths.output_filename
+            output_file_path = paths.output_file_path
             logger.debug(f"DEBUG FILE COPY: Expected output filename = {output_filename}")
-            logger.debug(f"DEBUG FILE COPY: Manifest name = {manifest_name}")
-            logger.debug(f"DEBUG FILE COPY: SBOM name = {sbom_name}")
-            logger.debug(f"DEBUG FILE COPY: Base name = {base_name}")
-            
-            # Check what files actually exist in the output directory
-            if os.path.exists(os.path.join(temp_dir, runtime)):
-                actual_files = os.listdir(os.path.join(temp_dir, runtime))
-                logger.debug(f"DEBUG FILE COPY: Actual files in output dir = {actual_files}")
-                for f in actual_files:
-                    if f.endswith(f'_{runtime}_analysis.json'):
-                        logger.debug(f"DEBUG FILE COPY: Found actual output file = {f}")
-                        # Try to read the actual file if our expected one doesn't exist
-                        if not os.path.exists(output_file_path):
-                            actual_file_path = os.path.join(temp_dir, runtime, f)
-                            logger.debug(f"DEBUG FILE COPY: Using actual file instead = {actual_file_path}")
-                            output_file_path = actual_file_path
-                            output_filename = f
+            logger.debug(f"DEBUG FILE COPY: Manifest name = {paths.manifest_name}")
+            logger.debug(f"DEBUG FILE COPY: SBOM name = {kwargs.get('sbom_name')}")
+            logger.debug(f"DEBUG FILE COPY: Base name = {paths.base_name}")
+            
+            # Prefer the expected file; otherwise use any analysis output the script actually wrote
+            output_entry = next((e for e in output_entries if e.name == output_filename), None)
+            if output_entry is None:
+                output_entry = next((e for e in output_entries if e.name.endswith(f'_{runtime}_analysis.json')), None)
+                if output_entry is not None:
+                    logger.debug(f"DEBUG FILE COPY: Using actual file instead = {output_entry.path}")
+                    output_file_path = output_entry.path
+                    output_filename = output_entry.name
             
             analysis_output = ''
             # Try to read output file regardless of success status (file might exist even on partial failure)
-            if os.path.exists(output_file_path):
+            if output_entry is not None:
                 try:
                     with open(output_file_path, 'r') as f:
                         analysis_output = f.read()
-                    logger.debug(f"Successfully read output file: {output_file_path} ({len(analysis_output)} chars)")
+                    logger.debug(f"Successfully read output file: {output_file_path} ({output_entry.stat().st_size} bytes)")
                     
                     # Copy output file to permanent output directory if provided
                     permanent_output_dir = kwargs.get('output_dir')
                     logger.debug(f"DEBUG FILE COPY: permanent_output_dir = {permanent_output_dir}")
-                    logger.debug(f"DEBUG FILE COPY: temp file exists = {os.path.exists(output_file_path)}")
                     logger.debug(f"DEBUG FILE COPY: temp file path = {output_file_path}")
                     if permanent_output_dir:
                         permanent_runtime_dir = os.path.join(permanent_output_dir, runtime)
@@ -550,24 +960,24 @@ class ContainerExecutionEnvironment(ExecutionEnvironment):
                         permanent_output_path = os.path.join(permanent_runtime_dir, output_filename)
                         logger.debug(f"DEBUG FILE COPY: Copying FROM {output_file_path} TO {permanent_output_path}")
                         logger.debug(f"DEBUG FILE COPY: Output filename being copied = {output_filename}")
-                        shutil.copy2(output_file_path, permanent_output_path)
-                        logger.debug(f"DEBUG FILE COPY: Copy completed - file exists = {os.path.exists(permanent_output_path)}")
+                        _fast_copy(output_file_path, permanent_output_path)
+                        logger.debug(f"DEBUG FILE COPY: Copy completed: {permanent_output_path}")
                     else:
                         logger.debug(f"DEBUG FILE COPY: No output_dir provided, file will not be copied")
                         
                 except Exception as e:
                     logger.warning(f"Failed to read output file {output_file_path}: {e}")
-                    analysis_output = run_result.stdout  # Fallback to stdout
+                    analysis_output = _decode(run_result.stdout)  # Fallback to stdout
             else:
                 logger.warning(f"Output file not found: {output_file_path}, using stdout")
-                analysis_output = run_result.stdout
+                analysis_output = _decode(run_result.stdout)
             
             return {
                 'success': success,
                 'output': analysis_output,
-                'error': run_result.stderr,
+                'error': _decode(run_result.stderr),
                 'environment': environment,
-                'build_output': build_result.stdout,
+                'build_output': _decode(build_result.stdout),
                 'image_name': image_name,
                 'analysis_command': analysis_cmd,
                 'output_file_path': output_file_path
@@ -589,106 +999,101 @@ class ContainerExecutionEnvironment(ExecutionEnvironment):
                 'environment': f'container_{runtime}_{kwargs.get("runtime_version", "unknown")}'
             }
     
+    @staticmethod
+    def _scan_output_dir(output_dir: str) -> Optional[List[os.DirEntry]]:
+        """List the output directory's entries in one scandir pass - returns None if it does not exist."""
+        try:
+            with os.scandir(output_dir) as entries:
+                return list(entries)
+        except FileNotFoundError:
+            return None
+    
+    def _build_env(self) -> Optional[Dict[str, str]]:
+        """Environment for image builds - Docker needs BuildKit enabled for RUN --mount cache mounts."""
+        if self.container_tool != 'docker':
+            return None  # Podman/Buildah support cache mounts and layer caching by default
+        env = os.environ.copy()
+        env['DOCKER_BUILDKIT'] = '1'
+        return env
+    
+    def _image_exists(self, image_name: str) -> bool:
+        """Check whether an image with this tag is already present locally."""
+        try:
+            # Only the exit status matters; inspect's JSON dump is discarded without a pipe
+            result = subprocess.run([self.container_tool, 'image', 'inspect', image_name],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30)
+            return result.returncode == 0
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return False
+    
+    def _get_image_spec(self, runtime: str, runtime_version: str, os_version: str) -> Tuple[str, str]:
+        """Memoized Dockerfile text and its content-addressed image tag - returns (dockerfile, image name)."""
+        key = (runtime, runtime_version, os_version)
+        spec = self._image_specs.get(key)
+        if spec is None:
+            logger.debug(f"Generating Dockerfile for {runtime} with OS {os_version}")
+            dockerfile_content = self._generate_dockerfile(runtime, runtime_version, os_version)
+            # The manifest is mounted at run time, so the Dockerfile fully determines the image
+            image_digest = hashlib.sha256(f'{dockerfile_content}\n{runtime_version}\n{os_version}'.encode()).hexdigest()[:16]
+            spec = self._image_specs[key] = (dockerfile_content, f'graviton-{runtime}-analysis:{image_digest}')
+        return spec
+    
     def _generate_dockerfile(self, runtime: str, runtime_version: str, os_version: str) -> str:
         """Generate Dockerfile with dynamic OS-based construction following design document."""
         # Extract OS name and version
         os_name, os_ver = self._parse_os_version(os_version)
         base_image = self._get_base_image(os_name, os_ver)
+        family = self._get_package_family(os_name)
         
-        # Generate OS-specific package manager commands
-        pkg_mgr_update, pkg_mgr_install = self._get_package_commands(os_name)
-        
-        # Build Dockerfile based on detected OS and runtime
-        # Note: Ruby uses its own base image, others use detected OS
-        dockerfile_lines = [f"FROM {base_image}"]
-        
-        if runtime == 'python':
-            if os_name in ['amazon-linux', 'amazon', 'centos', 'rhel', 'fedora']:
-                dockerfile_lines.extend([
-                    f"RUN {pkg_mgr_update}",
-                    f"RUN {pkg_mgr_install} bash python3 python3-pip gcc gcc-c++ python3-devel make",
-                    "RUN pip3 install openpyxl PyYAML defusedxml packaging psutil",
-                    "WORKDIR /workspace"
-                ])
-            else:
-                dockerfile_lines.extend([
-                    f"RUN {pkg_mgr_update}",
-                    f"RUN {pkg_mgr_install} bash python3 python3-pip gcc g++ python3-dev build-essential",
-                    "RUN pip3 install openpyxl PyYAML defusedxml packaging psutil 'urllib3<2.0'",
-                    "WORKDIR /workspace"
-                ])
-        elif runtime == 'nodejs':
-            # Use official Node.js Alpine image to avoid GLIBC compatibility issues
-            node_version = runtime_version if runtime_version != 'latest' else '20'
-            dockerfile_lines = [f"FROM node:{node_version}-alpine"]
-            dockerfile_lines.extend([
-                "RUN apk update",
-                "RUN apk add --no-cache bash gcc g++ make musl-dev python3-dev python3 py3-pip linux-headers libffi-dev openssl-dev curl",
-                "RUN pip3 install --break-system-packages PyYAML defusedxml packaging psutil openpyxl 'urllib3<2.0'",
-                "WORKDIR /workspace"
-            ])
-        elif runtime == 'dotnet':
-            # Use official Microsoft .NET SDK image (Debian-based)
-            dotnet_version = runtime_version if runtime_version != 'latest' else '8.0'
-            dockerfile_lines = [f"FROM mcr.microsoft.com/dotnet/sdk:{dotnet_version}"]
-            dockerfile_lines.extend([
-                "RUN apt-get update",
-                "RUN apt-get install -y bash python3 python3-pip",
-                "RUN pip3 install --break-system-packages PyYAML defusedxml packaging psutil openpyxl 'urllib3<2.0'",
-                "ENV DOTNET_CLI_TELEMETRY_OPTOUT=1",
-                "ENV DOTNET_SKIP_FIRST_TIME_EXPERIENCE=1",
-                "WORKDIR /workspace"
-            ])
-        elif runtime == 'ruby':
-            # Use Alpine Ruby image for faster builds and specific Ruby versions
-            ruby_version = runtime_version if runtime_version != 'latest' else '3.2'
-            dockerfile_lines = [f"FROM ruby:{ruby_version}-alpine"]
-            dockerfile_lines.extend([
-                "RUN apk update",
-                "RUN apk add --no-cache bash gcc g++ make musl-dev python3-dev python3 py3-pip linux-headers libffi-dev openssl-dev curl",
-                "RUN gem install bundler",
-                "RUN pip3 install --break-system-packages PyYAML defusedxml packaging psutil openpyxl 'urllib3<2.0'",
-                "WORKDIR /workspace"
-            ])
-        elif runtime == 'java':
-            if os_name in ['amazon-linux', 'amazon', 'centos', 'rhel', 'fedora']:
-                # RPM-based systems
-                dockerfile_lines.extend([
-                    f"RUN {pkg_mgr_update}",
-                    f"RUN {pkg_mgr_install} bash java-{runtime_version}-amazon-corretto-devel maven python3 python3-pip",
-                    "RUN pip3 install PyYAML defusedxml packaging psutil openpyxl 'requests<2.29' 'urllib3<2.0'",
-                    "WORKDIR /workspace"
-                ])
-            else:
-                # DEB-based systems
-                dockerfile_lines.extend([
-                    f"RUN {pkg_mgr_update}",
-                    f"RUN {pkg_mgr_install} bash openjdk-{runtime_version}-jdk maven python3 python3-pip",
-                    "RUN pip3 install PyYAML defusedxml packaging psutil openpyxl 'requests<2.29' 'urllib3<2.0'",
-                    "WORKDIR /workspace"
-                ])
-        else:
-            dockerfile_lines.extend(["WORKDIR /workspace"])
+        spec = self.RUNTIME_SPECS.get(runtime)
+        run = ''
+        env = ''
+        shell = self.BASH_SHELL
+        if spec is not None:
+            image_version = runtime_version if runtime_version != 'latest' else spec.default_version
+            if spec.base_image:
+                base_image = spec.base_image.format(version=image_version)
+                family = spec.base_family
+            elif family == 'apk' and spec.alpine_base_image:
+                base_image = spec.alpine_base_image.format(version=image_version)
+            if spec.base_image or family == 'apk':
+                shell = self.POSIX_SHELL  # bash is not guaranteed before the install
+            
+            # The whole toolchain is installed by a single RUN whose package caches live in BuildKit cache mounts
+            recipe = spec.recipes[family]
+            pkg_mgr_update, pkg_mgr_install = self._get_package_commands(family)
+            pkg_mgr_prepare, pkg_cache_dirs = self._get_package_cache(family)
+            packages = ' '.join(package.format(version=runtime_version) for package in recipe.packages)
+            run = self._compose_run(
+                pkg_mgr_prepare,
+                pkg_mgr_update,
+                f"{pkg_mgr_install} {packages}",
+                *spec.extra_commands,
+                self._pip_install(recipe.pip_deps, recipe.pip_flags),
+                cache_dirs=pkg_cache_dirs
+            )
+            env = ''.join(f"ENV {variable}\n" for variable in spec.env)
         
-        return "\n".join(dockerfile_lines)
+        return self.DOCKERFILE_TEMPLATE.format(
+            syntax=self.DOCKERFILE_SYNTAX, base=base_image,
+            shell=f"{shell}\n" if run else '', run=f"{run}\n" if run else '', env=env
+        )
+    
+    @staticmethod
+    def _pip_install(deps: Tuple[str, ...], flags: str = '') -> str:
+        """pip3 install command for the analyzer dependencies (wheels are cached in the pip cache mount)."""
+        return ' '.join(filter(None, ['pip3 install', flags, ' '.join(deps)]))
+    
+    @classmethod
+    def _compose_run(cls, *commands: str, cache_dirs: Tuple[str, ...] = ()) -> str:
+        """Chain shell commands into one RUN instruction (a single image layer) with pip and package caches mounted."""
+        mounts = ' '.join(f'--mount=type=cache,target={target},sharing=locked'
+                          for target in cache_dirs + (cls.PIP_CACHE_DIR,))
+        return f"RUN {mounts} \\\n    " + " && \\\n    ".join(command for command in commands if command)
     
     def _parse_os_version(self, os_version: str) -> tuple:
         """Parse OS version string into name and version."""
-        if ':' in os_version:
-            os_name, os_ver = os_version.split(':', 1)
-        elif os_version.startswith('amazon-linux-'):
-            # Special handling for amazon-linux-2023 format
-            os_name = 'amazon-linux'
-            os_ver = os_version.replace('amazon-linux-', '')
-        elif '-' in os_version:
-            parts = os_version.split('-')
-            os_name = parts[0]
-            os_ver = '-'.join(parts[1:]) if len(parts) > 1 else 'latest'
-        else:
-            os_name = os_version
-            os_ver = 'latest'
-        
-        return os_name.lower(), os_ver
+        return _parse_os_version(os_version)
     
     def _get_base_image(self, os_name: str, os_ver: str) -> str:
         """Get base image for OS - let Podman handle registry resolution."""
@@ -702,25 +1107,44 @@ class ContainerExecutionEnvironment(ExecutionEnvironment):
             return f'centos:{os_ver}'
         elif os_name == 'fedora':
             return f'fedora:{os_ver}'
+        elif os_name == 'alpine':
+            return f'alpine:{os_ver}'
         else:
             return 'amazonlinux:2023'  # Default to Amazon Linux 2023
     
-    def _get_package_commands(self, os_name: str) -> tuple:
-        """Get package manager commands for OS."""
-        if os_name in ['ubuntu', 'debian']:
-            return "apt-get update", "apt-get install -y"
+    def _get_package_family(self, os_name: str) -> str:
+        """Get the package family (rpm, deb or apk) for OS."""
+        if os_name == 'alpine':
+            return 'apk'
         elif os_name in ['amazon-linux', 'amazon', 'centos', 'rhel', 'fedora']:
+            return 'rpm'
+        else:
+            return 'deb'  # Default to apt
+    
+    def _get_package_commands(self, family: str) -> tuple:
+        """Get package manager (update, install) commands for a package family."""
+        if family == 'apk':
+            return "", "apk add --no-cache"  # --no-cache fetches a fresh index, no separate update
+        elif family == 'rpm':
             return "yum update -y", "yum install -y"
         else:
-            return "apt-get update", "apt-get install -y"  # Default to apt
+            return "apt-get update", "apt-get install -y"
     
-    def _get_analysis_command(self, runtime: str, manifest_name: str, sbom_name: str = None) -> str:
+    def _get_package_cache(self, family: str) -> tuple:
+        """Get (preparation command, cache mount directories) for a package family."""
+        if family == 'apk':
+            return '', ()  # apk add --no-cache keeps no package cache
+        if family == 'rpm':
+            return '', self.YUM_CACHE_DIRS
+        return self.APT_KEEP_CACHE, self.APT_CACHE_DIRS
+    
+    def _get_analysis_command(self, runtime: str, paths: AnalysisPaths) -> str:
         """Get analysis command for runtime-specific package installer scripts."""
-        script_name = get_runtime_script_name(runtime)
-        output_filename = self.generate_output_filename(manifest_name, runtime, sbom_name)
+        script_name = _script_name(runtime)
+        output_filename = paths.output_filename
         
         logger.debug(f"Output File Location: ./{runtime}/{output_filename}")
-        base_cmd = f'mkdir -p ./{runtime} && python3 graviton_validator/analysis/{script_name} "{manifest_name}"'
+        base_cmd = f'mkdir -p ./{runtime} && python3 {self.PROJECT_ROOT}/graviton_validator/analysis/{script_name} "{paths.manifest_name}"'
         if runtime == 'java':
             base_cmd += f' --runtime-test --deep-scan'
         base_cmd += f' -o "./{runtime}/{output_filename}"'
@@ -743,99 +1167,91 @@ class ContainerExecutionEnvironment(ExecutionEnvironment):
             return
             
         logger.debug(f"Cleaning up {len(self.created_images)} Docker images and {len(self.temp_dirs)} temp directories")
+        if self.persistent_images:
+            logger.debug(f"Keeping {len(self.persistent_images)} content-addressed toolchain images for reuse: {sorted(self.persistent_images)}")
         
-        # Clean up Docker images
-        for image in self.created_images:
-            try:
-                logger.debug(f"Removing {self.container_tool} image: {image}")
-                result = subprocess.run([self.container_tool, 'rmi', '-f', image], 
-                                     capture_output=True, timeout=30)
-                if result.returncode == 0:
-                    logger.debug(f"Successfully removed {self.container_tool} image: {image}")
-                else:
-                    logger.warning(f"Failed to remove {self.container_tool} image {image}: {result.stderr}")
-            except Exception as e:
-                logger.warning(f"Exception removing {self.container_tool} image {image}: {e}")
-        
-        # Clean up temp directories
-        for temp_dir in self.temp_dirs:
-            try:
-                logger.debug(f"Removing temporary directory: {temp_dir}")
-                shutil.rmtree(temp_dir)
-            except Exception as e:
-                logger.warning(f"Failed to remove temporary directory {temp_dir}: {e}")
+        # Clean up Docker images alongside the temp directories
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            temp_dirs_done = executor.submit(_remove_temp_dirs, self.temp_dirs)
+            self._remove_engine_objects('image', 'rmi', self.created_images)
+            temp_dirs_done.result()
         
+        self._ready_images.clear()
+        self._workspace_root = None
         self.created_images.clear()
         self.temp_dirs.clear()
         logger.debug("Container cleanup completed")
     
-    def _copy_graviton_validator_module(self, temp_dir: str):
-        """Copy entire graviton_validator module and main script to Docker context."""
+    def _remove_engine_objects(self, kind: str, command: str, names: List[str]):
+        """Force-remove containers or images in a single engine call, logging instead of raising on failure."""
+        if not names:
+            return
         try:
-            # Copy graviton_validator.py (main script)
-            main_script = Path(__file__).parent.parent.parent / 'graviton_validator.py'
-            if main_script.exists():
-                dest_main = os.path.join(temp_dir, 'graviton_validator.py')
-                shutil.copy2(str(main_script), dest_main)
-                logger.debug(f"Copied graviton_validator.py to Docker context")
-            else:
-                logger.warning(f"Main script not found: {main_script}")
-            
-            # Copy entire graviton_validator module
-            module_dir = Path(__file__).parent.parent
-            dest_module = os.path.join(temp_dir, 'graviton_validator')
-            if module_dir.exists():
-                shutil.copytree(str(module_dir), dest_module)
-                logger.debug(f"Copied graviton_validator module to Docker context")
-            else:
-                logger.warning(f"Module directory not found: {module_dir}")
-            
-            # Copy knowledge_bases directory if it exists
-            kb_dir = Path(__file__).parent.parent.parent / 'knowledge_bases'
-            if kb_dir.exists():
-                dest_kb = os.path.join(temp_dir, 'knowledge_bases')
-                shutil.copytree(str(kb_dir), dest_kb)
-                logger.debug(f"Copied knowledge_bases to Docker context")
-            
-            # Copy deny_lists directory if it exists
-            deny_dir = Path(__file__).parent.parent.parent / 'deny_lists'
-            if deny_dir.exists():
-                dest_deny = os.path.join(temp_dir, 'deny_lists')
-                shutil.copytree(str(deny_dir), dest_deny)
-                logger.debug(f"Copied deny_lists to Docker context")
-            
-            # Copy schemas directory if it exists (needed for OS detection)
-            schemas_dir = Path(__file__).parent.parent.parent / 'schemas'
-            if schemas_dir.exists():
-                dest_schemas = os.path.join(temp_dir, 'schemas')
-                shutil.copytree(str(schemas_dir), dest_schemas)
-                logger.debug(f"Copied schemas to Docker context")
-                
+            logger.debug(f"Removing {len(names)} {self.container_tool} {kind}(s): {names}")
+            # stdout (removed IDs) is never read; only stderr is kept, for failure reports
+            result = subprocess.run([self.container_tool, command, '-f', *names],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=30 + 2 * len(names))
+            if result.returncode == 0:
+                logger.debug(f"Successfully removed {self.container_tool} {kind}(s): {names}")
+                return
+            # Attribute failures to the names the engine mentions; otherwise report the whole batch
+            stderr = _decode(result.stderr)
+            failed = [name for name in names if name in stderr] or names
+            for name in failed:
+                logger.warning(f"Failed to remove {self.container_tool} {kind} {name}: {stderr}")
         except Exception as e:
-            logger.warning(f"Failed to copy graviton_validator module: {e}")
-    
-    def _copy_standalone_tester(self, runtime: str, temp_dir: str):
-        """Copy standalone tester script to Docker context."""
-        script_name = get_runtime_script_name(runtime)
-        if script_name != f'{runtime}_package_installer.py':  # Only copy if script exists
-            script_path = Path(__file__).parent / script_name
-            
-            if script_path.exists():
-                dest_path = os.path.join(temp_dir, script_name)
-                shutil.copy2(str(script_path), dest_path)
-                logger.debug(f"Copied {script_name} to Docker context")
+            logger.warning(f"Exception removing {self.container_tool} {kind}(s) {names}: {e}")
+    
+    def _get_workspace_root(self) -> str:
+        """Lazily create the host directory shared with every analysis container."""
+        if self._workspace_root is None:
+            self._workspace_root = tempfile.mkdtemp(prefix='graviton_docker_')
+            self.temp_dirs.append(self._workspace_root)
+            logger.debug(f"Created shared container workspace root: {self._workspace_root}")
+        return self._workspace_root
+    
+    def _container_workdir(self, temp_dir: str) -> str:
+        """Path of an analysis directory as seen from inside the containers."""
+        return f'{self.ANALYSES_ROOT}/{os.path.basename(temp_dir)}'
+    
+    def _get_manifest_mounts(self, runtime: str, manifest_path: str, paths: AnalysisPaths) -> List[str]:
+        """Read-only bind mounts placing the manifest in the analysis directory; the container runs as root."""
+        source = os.path.abspath(manifest_path)
+        workdir = self._container_workdir(paths.work_dir)
+        targets = [paths.manifest_name]
+        
+        # Also expose the manifest under its standard name for runtime compatibility
+        if runtime == 'nodejs' and not paths.manifest_name == 'package.json':
+            targets.append('package.json')
+        
+        return [arg for target in targets
+                for arg in ('--mount', f'type=bind,source={source},target={workdir}/{target},readonly')]
+    
+    def _get_project_mounts(self) -> List[str]:
+        """Read-only bind mounts placing the validator module and data directories under PROJECT_ROOT."""
+        mounts = []
+        for name in ('graviton_validator.py', 'graviton_validator', 'knowledge_bases', 'deny_lists',
+                     'schemas'):  # schemas are needed for OS detection
+            source = str(_REPO_ROOT / name)
+            if os.path.exists(source):
+                mounts.extend(['--mount', f'type=bind,source={source},target={self.PROJECT_ROOT}/{name},readonly'])
             else:
-                logger.warning(f"Standalone tester script not found: {script_path}")
-
+                logger.warning(f"Mount source not found: {source}")
+        return mounts
+    
+    def _get_container_mounts(self) -> List[str]:
+        """Mounts every analysis container gets: the shared analyses root and the read-only project tree."""
+        return ['-v', f'{self._get_workspace_root()}:{self.ANALYSES_ROOT}', *self._get_project_mounts()]
+    
 
 class ExecutionEnvironmentFactory:
     """Factory for creating execution environments."""
     
     @staticmethod
-    def create_environment(use_containers: bool = False) -> ExecutionEnvironment:
+    def create_environment(use_containers: bool = False, persist_images: bool = False) -> ExecutionEnvironment:
         """Create appropriate execution environment."""
         if use_containers:
-            return ContainerExecutionEnvironment()
+            return ContainerExecutionEnvironment(persist_images=persist_images)
         else:
             return NativeExecutionEnvironment()
     
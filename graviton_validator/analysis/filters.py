@@ -2,14 +2,274 @@
 Component filtering system for excluding system packages and OS/kernel components.
 """
 
+import functools
+import logging
 import re
-from typing import Dict, List, Optional, Tuple
+import sys
+import threading
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Pattern, Tuple
 from enum import Enum
 
 from ..models import SoftwareComponent
 from .config import FilterConfig
 from ..os_detection import OSDetector
 from ..os_detection.os_configs import OSConfigManager
+from .runtime_detection import RuntimeDetectionService
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+# SBOM property keys read on every component; interned once at load
+_PKG_TYPE = sys.intern("package:type")
+_SYFT_PKG_TYPE = sys.intern("syft:package:type")
+_PKG_SOURCE = sys.intern("package:source")
+
+# Property/type markers checked before any name pattern matching
+_SYSTEM_PACKAGE_TYPES = frozenset({"system-package", "os-package", "system"})
+_SYSTEM_PACKAGE_SOURCES = frozenset({"system", "os", "kernel"})
+_KERNEL_MODULE_TYPES = frozenset({"linux-kernel-module", "kernel-module", "driver"})
+_KERNEL_MODULE_PACKAGE_TYPES = frozenset({"linux-kernel-module", "kernel-module"})
+
+# Used for empty categories: an empty alternation would match every name
+_NEVER_MATCH = re.compile(r'(?!)')
+
+# Constructs that make backtracking blow up on long names: adjacent .* runs and a
+# quantified group whose body ends in a quantifier, e.g. (a+)+ or (.*)*
+_BACKTRACKING_RISK_RE = re.compile(r'\.\*\.\*|\((?:[^()\\]|\\.)*[*+]\)[*+{]')
+
+# A trailing .* whose dot is escaped (odd run of backslashes), i.e. a literal "." repeated
+_ESCAPED_TRAILING_DOT_STAR_RE = re.compile(r'(?<!\\)(?:\\\\)*\\\.\*$')
+
+# A global inline flag group such as (?i) or (?x); it must lead the whole expression, so a
+# pattern using one cannot be placed inside the union's alternation
+_GLOBAL_FLAGS_RE = re.compile(r'\(\?[aiLmsux]+\)')
+
+# Unescaped escapes that name a character by code (\x41, \u0041, \N{...}, octal \101) or
+# refer to a group by number; lowercasing leaves the former naming uppercase characters and
+# the union renumbers groups, so such patterns are matched on their own with IGNORECASE
+_CODE_ESCAPE_RE = re.compile(r'(?<!\\)(?:\\\\)*\\[xuUN0-9]')
+
+
+def _lowercase_pattern(pattern: str) -> str:
+    """
+    Lowercase a pattern's literal characters, leaving escape sequences (\\S, \\W, \\A...) intact.
+    
+    Escapes that name a character by code are left as they are and would still name an
+    uppercase character; _joins_union keeps patterns containing them out of the union.
+    """
+    chars = []
+    escaped = False
+    for char in pattern:
+        chars.append(char if escaped else char.lower())
+        escaped = not escaped and char == "\\"
+    return "".join(chars)
+
+
+@functools.lru_cache(maxsize=None)
+def _normalize_pattern(pattern: str) -> str:
+    """
+    Normalize a detection pattern for prefix matching with re.match.
+    
+    Drops surrounding whitespace, a leading ^ (the union is anchored with \\A) and a
+    trailing unescaped .* (a prefix match needs nothing after the literal part). A leading
+    .* is kept: under match semantics it means "anywhere in the name". Warns once per
+    pattern about constructs prone to catastrophic backtracking.
+    """
+    normalized = pattern.strip()
+    if normalized.startswith("^"):
+        normalized = normalized[1:]
+    if normalized.endswith(".*") and not _ESCAPED_TRAILING_DOT_STAR_RE.search(normalized):
+        normalized = normalized[:-2]
+    if _BACKTRACKING_RISK_RE.search(normalized):
+        logger.warning(f"Detection pattern may backtrack excessively on long names: {pattern}")
+    return normalized
+
+
+class _HyperscanUnion:
+    """Hyperscan block-mode database exposing the match() subset the detector uses."""
+    
+    def __init__(self, expressions: List[str]):
+        self.pattern = "|".join(expressions)
+        self._database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        # UTF8 and UCP give ., \w, \s and \d the code point semantics re applies to str patterns
+        flags = (hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_ALLOWEMPTY
+                 | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+        # Each expression is anchored with ^ so a hit means a match at the start, as with re.match
+        self._database.compile(
+            expressions=[f"^(?:{expression})".encode() for expression in expressions],
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=[flags] * len(expressions),
+        )
+        # A scratch space may only be used by one scan at a time, so each thread gets its own
+        self._local = threading.local()
+        self._expressions = expressions
+        self._fallback = None
+    
+    def match(self, text: str) -> Optional[bool]:
+        """Return True if any expression matches at the start of text, else None."""
+        try:
+            data = text.encode()
+        except UnicodeEncodeError:
+            # Lone surrogates are not valid UTF-8; leave such names to re
+            if self._fallback is None:
+                self._fallback = re.compile("\\A(?:" + "|".join(f"(?:{e})" for e in self._expressions) + ")")
+            return True if self._fallback.match(text) else None
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self._database)
+        matched = []
+        self._database.scan(data, match_event_handler=lambda *_: matched.append(True), scratch=scratch)
+        return True if matched else None
+
+
+def _joins_union(pattern: str) -> bool:
+    """Whether a pattern can be lowercased and placed inside the shared alternation."""
+    expression = _lowercase_pattern(_normalize_pattern(pattern))
+    if _GLOBAL_FLAGS_RE.search(expression) or _CODE_ESCAPE_RE.search(expression):
+        return False
+    try:
+        re.compile(f"\\A(?:{expression})")
+    except re.error:
+        return False
+    return True
+
+
+def _compile_fallback(patterns: List[str]) -> Tuple[Pattern, ...]:
+    """Compile patterns individually with IGNORECASE, as re.match(pattern, name, re.IGNORECASE) would."""
+    compiled = []
+    for pattern in patterns:
+        try:
+            compiled.append(re.compile(pattern, re.IGNORECASE))
+        except re.error as e:
+            logger.warning(f"Ignoring invalid detection pattern {pattern!r}: {e}")
+    return tuple(compiled)
+
+
+def _compile_union(patterns: List[str]) -> Pattern:
+    """
+    Compile a category's patterns into one alternation so a name is scanned once.
+    
+    Callers match lowercased names, so the patterns are lowercased here instead of paying for
+    IGNORECASE case folding on every match. This assumes the ASCII package name alphabet.
+    Patterns the lowercasing would break (character code escapes, inline global flags) are
+    filtered out beforehand by _joins_union and matched individually with IGNORECASE.
+    
+    Prefers a Hyperscan database, then RE2, when available: both match user-supplied patterns
+    in linear time. Falls back to the standard library for patterns they cannot express
+    (e.g. backreferences, lookarounds). Raises re.error if even that cannot compile the
+    alternation (e.g. two patterns defining the same group name).
+    """
+    if not patterns:
+        return _NEVER_MATCH
+    expressions = [_lowercase_pattern(_normalize_pattern(pattern)) for pattern in patterns]
+    if HYPERSCAN_AVAILABLE:
+        try:
+            return _HyperscanUnion(expressions)
+        except hyperscan.error:
+            pass
+    union = "\\A(?:" + "|".join(f"(?:{expression})" for expression in expressions) + ")"
+    if RE2_AVAILABLE:
+        try:
+            options = re2.Options()
+            # Unsupported patterns are expected here and fall back to re; don't log them to stderr
+            options.log_errors = False
+            return re2.compile(union, options)
+        except re2.error:
+            pass
+    return re.compile(union)
+
+
+class CategoryMatcher(NamedTuple):
+    """Compiled matchers for one detection pattern category."""
+    exact: FrozenSet[str]
+    prefixes: Tuple[str, ...]
+    suffixes: Tuple[str, ...]
+    union: Pattern
+    fallback: Tuple[Pattern, ...]
+
+
+# Unescaped characters that make a pattern more than a literal string
+_REGEX_METACHARS = frozenset(".^$*+?{}[]|()")
+
+
+def _literal_text(pattern: str) -> Optional[str]:
+    """Return the text a pattern matches literally, or None if it uses any regex construct."""
+    chars = []
+    escaped = False
+    for char in pattern:
+        if escaped:
+            # \d, \w, \A, backreferences... are not literals
+            if char.isalnum():
+                return None
+            chars.append(char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char in _REGEX_METACHARS:
+            return None
+        else:
+            chars.append(char)
+    return None if escaped else "".join(chars)
+
+
+def _compile_category(patterns: List[str]) -> CategoryMatcher:
+    """
+    Split a category's patterns into literal exact/prefix/suffix checks and a regex union.
+    
+    After normalization a pattern of the form "lit$" is an exact name, "lit" a prefix and
+    ".*lit$" a suffix; those are answered with set membership and str.startswith/endswith
+    on the lowercased name. The remaining patterns go through the regex union, except
+    those that cannot join it, which are matched one by one with IGNORECASE.
+    """
+    exact, prefixes, suffixes, regex_patterns = set(), [], [], []
+    for pattern in patterns:
+        normalized = _lowercase_pattern(_normalize_pattern(pattern))
+        if normalized.endswith("$"):
+            body = normalized[:-1]
+            if body.startswith(".*"):
+                literal = _literal_text(body[2:])
+                if literal is not None:
+                    suffixes.append(literal)
+                    continue
+            else:
+                literal = _literal_text(body)
+                if literal is not None:
+                    exact.add(literal)
+                    continue
+        else:
+            literal = _literal_text(normalized)
+            if literal is not None:
+                prefixes.append(literal)
+                continue
+        regex_patterns.append(pattern)
+    
+    union_patterns = [pattern for pattern in regex_patterns if _joins_union(pattern)]
+    fallback_patterns = [pattern for pattern in regex_patterns if pattern not in union_patterns]
+    try:
+        union = _compile_union(union_patterns)
+    except re.error:
+        union, fallback_patterns = _NEVER_MATCH, regex_patterns
+    return CategoryMatcher(frozenset(exact), tuple(prefixes), tuple(suffixes), union,
+                           _compile_fallback(fallback_patterns))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_runtime_detector() -> RuntimeDetectionService:
+    """Return the shared runtime detection service; its patterns are fixed after construction."""
+    return RuntimeDetectionService()
 
 
 class ComponentCategory(Enum):
@@ -20,6 +280,14 @@ class ComponentCategory(Enum):
     KERNEL_MODULE = "kernel_module"
 
 
+# Categories filter_system_packages routes to the system component list
+_SYSTEM_CATEGORIES = frozenset({
+    ComponentCategory.SYSTEM_COMPATIBLE,
+    ComponentCategory.SYSTEM_UNKNOWN,
+    ComponentCategory.KERNEL_MODULE,
+})
+
+
 class ComponentFilter:
     """Component filtering logic for excluding system packages and OS/kernel components."""
     
@@ -46,6 +314,13 @@ class ComponentFilter:
         # OS-aware components
         self.os_config_manager = os_config_manager or OSConfigManager()
         self.sbom_format = sbom_format
+        
+        # Per-OS (lowercased package_patterns, package_types) read lazily from the OS config.
+        # The snapshot is not refreshed; construct a new filter if the OS config changes.
+        self._os_package_rules: Dict[str, Tuple[Tuple[str, ...], FrozenSet[str]]] = {}
+        
+        # Runtime detection only reads name, type and PURL, so results are cached on those
+        self._detect_runtime = functools.lru_cache(maxsize=2048)(self._detect_runtime_uncached)
     
     def should_exclude_component(self, component: Dict, sbom_source: str, detected_os: Optional[str] = None) -> bool:
         """
@@ -59,26 +334,55 @@ class ComponentFilter:
         Returns:
             True if component should be excluded, False otherwise
         """
-        # For app_identifier SBOMs: exclude both system packages and OS/kernel components
+        return self._should_exclude(component.get("name"), component.get("type"),
+                                    component.get("properties"), sbom_source)
+    
+    def _should_exclude(self, name: Optional[str], component_type: Optional[str],
+                        properties: Optional[Dict], sbom_source: str) -> bool:
+        """Field-level implementation of should_exclude_component."""
+        return self._exclusion_check(sbom_source)(name, component_type, properties)
+    
+    def _exclusion_check(self, sbom_source: str):
+        """Select the exclusion check specialized for an SBOM source; it is constant across a filter pass."""
         if sbom_source == "app_identifier":
-            if self.is_system_package(component) or self.is_os_kernel_component(component):
-                return True
-        
-        # For third-party SBOMs: only exclude OS/kernel components that are NOT system packages
-        elif sbom_source == "third_party":
-            # If it's explicitly marked as a system package, don't exclude it
-            if self.is_system_package(component):
-                return False
-            # Otherwise, exclude if it's an OS/kernel component
-            if self.is_os_kernel_component(component):
-                return True
-        
-        # For other SBOM sources: only exclude OS/kernel components
-        else:
-            if self.is_os_kernel_component(component):
-                return True
-        
-        return False
+            return self._exclude_app_identifier
+        if sbom_source == "third_party":
+            return self._exclude_third_party
+        return self._exclude_other
+    
+    def _exclude_app_identifier(self, name: Optional[str], component_type: Optional[str],
+                                properties: Optional[Dict]) -> bool:
+        """For app_identifier SBOMs: exclude both system packages and OS/kernel components."""
+        # Property/type markers first; name patterns only when they are inconclusive
+        return (
+            self._has_system_package_marker(component_type, properties) or
+            self._has_kernel_module_marker(component_type, properties) or
+            self.os_kernel_detector.is_system_package_name((name or "").lower()) or
+            self._matches_os_kernel_names(name)
+        )
+    
+    def _exclude_third_party(self, name: Optional[str], component_type: Optional[str],
+                             properties: Optional[Dict]) -> bool:
+        """For third-party SBOMs: only exclude OS/kernel components that are NOT system packages."""
+        # If it's explicitly marked as a system package, don't exclude it. A kernel marker
+        # alone is not decisive: a system package name match still keeps the component
+        if (self._has_system_package_marker(component_type, properties) or
+                self.os_kernel_detector.is_system_package_name((name or "").lower())):
+            return False
+        # Otherwise, exclude if it's an OS/kernel component
+        return self._has_kernel_module_marker(component_type, properties) or self._matches_os_kernel_names(name)
+    
+    def _exclude_other(self, name: Optional[str], component_type: Optional[str],
+                       properties: Optional[Dict]) -> bool:
+        """For other SBOM sources: only exclude OS/kernel components."""
+        return self._has_kernel_module_marker(component_type, properties) or self._matches_os_kernel_names(name)
+    
+    def _matches_os_kernel_names(self, name: Optional[str]) -> bool:
+        """Check the kernel module, system library and OS utility name patterns."""
+        return (
+            self.os_kernel_detector.is_kernel_module_by_name(name or "") or
+            self._is_system_library_or_utility(name)
+        )
     
     def filter_components(self, components: List[SoftwareComponent], sbom_source: str, detected_os: Optional[str] = None) -> List[SoftwareComponent]:
         """
@@ -92,21 +396,12 @@ class ComponentFilter:
         Returns:
             Filtered list of SoftwareComponent objects
         """
-        filtered_components = []
-        
-        for component in components:
-            # Convert SoftwareComponent to dict for compatibility with existing methods
-            component_dict = {
-                "name": component.name,
-                "version": component.version,
-                "type": component.component_type,
-                "properties": component.properties
-            }
-            
-            if not self.should_exclude_component(component_dict, sbom_source, detected_os):
-                filtered_components.append(component)
-        
-        return filtered_components
+        exclude = self._exclusion_check(sbom_source)
+        # Read the fields directly rather than marshalling each component into a dict
+        return [
+            component for component in components
+            if not exclude(component.name, component.component_type, component.properties)
+        ]
     
     def is_system_package(self, component: Dict) -> bool:
         """
@@ -121,35 +416,42 @@ class ComponentFilter:
         Returns:
             True if component is a system package, False otherwise
         """
-        # Primary check: app_identifier.sh system package marker
-        if isinstance(component.get("properties"), dict):
-            package_type = component["properties"].get("package:type")
-            if package_type == "system-package":
+        return self._is_system_package(component.get("name"), component.get("type"), component.get("properties"))
+    
+    def is_system_package_component(self, component: SoftwareComponent) -> bool:
+        """
+        Check if a SoftwareComponent is a system package, without building a component dict.
+        
+        Args:
+            component: SoftwareComponent object
+            
+        Returns:
+            True if component is a system package, False otherwise
+        """
+        return self._is_system_package(component.name, component.component_type, component.properties)
+    
+    def _is_system_package(self, name: Optional[str], component_type: Optional[str],
+                           properties: Optional[Dict]) -> bool:
+        """Field-level implementation of is_system_package."""
+        if self._has_system_package_marker(component_type, properties):
+            return True
+        
+        # Check for system package name patterns from JSON configuration (compiled once by the detector)
+        return self.os_kernel_detector.is_system_package_name((name or "").lower())
+    
+    def _has_system_package_marker(self, component_type: Optional[str], properties: Optional[Dict]) -> bool:
+        """Check the system package property and type markers (no name matching)."""
+        # Primary check: app_identifier.sh system package marker (properties are often empty)
+        if properties and isinstance(properties, dict):
+            if properties.get(_PKG_TYPE) == "system-package":
                 return True
             
             # Additional property checks for system packages
-            package_source = component["properties"].get("package:source", "").lower()
-            if package_source in ["system", "os", "kernel"]:
+            if (properties.get(_PKG_SOURCE) or "").lower() in _SYSTEM_PACKAGE_SOURCES:
                 return True
         
         # Check component type for system indicators
-        component_type = (component.get("type") or "").lower()
-        if component_type in ["system-package", "os-package", "system"]:
-            return True
-        
-        # Check for system package name patterns from JSON configuration
-        component_name = (component.get("name") or "").lower()
-        
-        # Get system package name patterns from OS config
-        detection_rules = self.os_kernel_detector.os_config_manager.get_all_detection_rules()
-        system_patterns = detection_rules.get("system_package_patterns", {})
-        system_package_patterns = system_patterns.get("system_package_names", [])
-        
-        for pattern in system_package_patterns:
-            if re.match(pattern, component_name, re.IGNORECASE):
-                return True
-        
-        return False
+        return (component_type or "").lower() in _SYSTEM_PACKAGE_TYPES
     
     def is_os_kernel_component(self, component: Dict) -> bool:
         """
@@ -161,53 +463,73 @@ class ComponentFilter:
         Returns:
             True if component is OS/kernel related, False otherwise
         """
-        return self._is_kernel_module_by_format(component) or self._is_system_library_or_utility(component)
+        return self._is_os_kernel_component(component.get("name"), component.get("type"), component.get("properties"))
+    
+    def is_os_kernel_software_component(self, component: SoftwareComponent) -> bool:
+        """
+        Check if a SoftwareComponent is an OS or kernel component, without building a component dict.
+        
+        Args:
+            component: SoftwareComponent object
+            
+        Returns:
+            True if component is OS/kernel related, False otherwise
+        """
+        return self._is_os_kernel_component(component.name, component.component_type, component.properties)
+    
+    def _is_os_kernel_component(self, name: Optional[str], component_type: Optional[str],
+                                properties: Optional[Dict]) -> bool:
+        """Field-level implementation of is_os_kernel_component."""
+        return (self._is_kernel_module_by_format(name, component_type, properties) or
+                self._is_system_library_or_utility(name))
     
-    def _is_kernel_module_by_format(self, component: Dict) -> bool:
+    def _is_kernel_module_by_format(self, component_name: Optional[str], component_type: Optional[str],
+                                    properties: Optional[Dict]) -> bool:
         """
         Check if component is a kernel module based on SBOM format.
         
         Args:
-            component: Component data from SBOM
+            component_name: Component name
+            component_type: Component type
+            properties: Component properties
             
         Returns:
             True if component is a kernel module
         """
-        component_name = component.get("name", "")
-        component_type = component.get("type", "")
-        properties = component.get("properties", {})
+        if self._has_kernel_module_marker(component_type, properties):
+            return True
         
+        # Fallback: check name patterns for all formats
+        return self.os_kernel_detector.is_kernel_module_by_name(component_name or "")
+    
+    def _has_kernel_module_marker(self, component_type: Optional[str], properties: Optional[Dict]) -> bool:
+        """Check the SBOM-format-specific kernel module markers (no name matching)."""
         # CycloneDX format: check syft:package:type property
         if self.sbom_format == "CycloneDX":
-            syft_package_type = properties.get("syft:package:type", "")
-            if syft_package_type.lower() == "linux-kernel-module":
-                return True
+            if not properties:
+                return False
+            return (properties.get(_SYFT_PKG_TYPE) or "").lower() == "linux-kernel-module"
         
         # app_identifier format: check package:type property
-        elif self.sbom_format == "app_identifier":
-            package_type = properties.get("package:type", "")
-            if package_type.lower() in ["linux-kernel-module", "kernel-module"]:
-                return True
+        if self.sbom_format == "app_identifier":
+            if not properties:
+                return False
+            return (properties.get(_PKG_TYPE) or "").lower() in _KERNEL_MODULE_PACKAGE_TYPES
         
         # SPDX or unknown format: check main component type
-        else:
-            if component_type.lower() in ["linux-kernel-module", "kernel-module", "driver"]:
-                return True
-        
-        # Fallback: check name patterns for all formats
-        return self.os_kernel_detector.is_kernel_module_by_name(component_name)
+        return (component_type or "").lower() in _KERNEL_MODULE_TYPES
     
-    def _is_system_library_or_utility(self, component: Dict) -> bool:
+    def _is_system_library_or_utility(self, component_name: Optional[str]) -> bool:
         """
         Check if component is a system library or OS utility.
         
         Args:
-            component: Component data from SBOM
+            component_name: Component name
             
         Returns:
             True if component is a system library or OS utility
         """
-        component_name = component.get("name", "")
+        component_name = component_name or ""
         return (
             self.os_kernel_detector.is_system_library(component_name) or
             self.os_kernel_detector.is_os_utility(component_name)
@@ -225,12 +547,27 @@ class ComponentFilter:
         Returns:
             True if component is a system package for the detected OS
         """
+        return self._is_system_package_by_os(component.get("name"), component.get("type"), component.get("version"),
+                                             component.get("properties"), detected_os, os_knowledge_base)
+    
+    def _is_system_package_by_os(self, component_name: Optional[str], component_type: Optional[str],
+                                 version: Optional[str], properties: Optional[Dict],
+                                 detected_os: str, os_knowledge_base=None) -> bool:
+        """Field-level implementation of is_system_package_by_os."""
         if not detected_os:
-            return self.is_system_package(component)
+            return self._is_system_package(component_name, component_type, properties)
         
-        component_name = component.get("name", "")
+        component_name = component_name or ""
         
         # First check if component exists in OS-specific knowledge base
+        if self._is_os_native(component_name, os_knowledge_base):
+            return True
+        
+        # Fallback to pattern-based detection for backward compatibility
+        return self._matches_os_package_rules(component_name, component_type or "", version, properties, detected_os)
+    
+    def _is_os_native(self, component_name: str, os_knowledge_base) -> bool:
+        """Check if the knowledge base marks a component as OS native."""
         if os_knowledge_base and hasattr(os_knowledge_base, 'find_software'):
             software_entry = os_knowledge_base.find_software(component_name)
             if software_entry:
@@ -238,25 +575,37 @@ class ComponentFilter:
                 metadata = software_entry.metadata or {}
                 if isinstance(metadata, dict) and metadata.get('os_native', False):
                     return True
-        
-        # Fallback to pattern-based detection for backward compatibility
-        patterns = self.os_config_manager.get_detection_patterns(detected_os)
+        return False
+    
+    def _matches_os_package_rules(self, component_name: str, component_type: str, version: Optional[str],
+                                  properties: Optional[Dict], detected_os: str) -> bool:
+        """Check OS version patterns, OS package types, then general system package detection."""
+        package_patterns, package_types = self._get_os_package_rules(detected_os)
         
         # Check version patterns
-        version = component.get("version", "")
         if version:
-            for pattern in patterns.get("package_patterns", []):
-                if pattern.lower() in version.lower():
-                    return True
+            version_lower = version.lower()
+            if any(pattern in version_lower for pattern in package_patterns):
+                return True
         
         # Check component type against OS package types
-        component_type = component.get("type", "")
-        os_info = self.os_config_manager.get_os_info(detected_os)
-        if os_info and component_type in os_info.get("package_types", []):
+        if component_type in package_types:
             return True
         
         # Fallback to general system package detection
-        return self.is_system_package(component)
+        return self._is_system_package(component_name, component_type, properties)
+    
+    def _get_os_package_rules(self, detected_os: str) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+        """Return the cached (lowercased package_patterns, package_types) for an OS."""
+        rules = self._os_package_rules.get(detected_os)
+        if rules is None:
+            os_info = self.os_config_manager.get_os_info(detected_os) or {}
+            package_patterns = self.os_config_manager.get_detection_patterns(detected_os).get("package_patterns", [])
+            rules = self._os_package_rules[detected_os] = (
+                tuple(pattern.lower() for pattern in package_patterns),
+                frozenset(os_info.get("package_types", [])),
+            )
+        return rules
     
     def is_graviton_compatible_os(self, os_name: str, os_version: Optional[str] = None) -> bool:
         """
@@ -281,12 +630,15 @@ class ComponentFilter:
         Returns:
             Runtime type string ('java', 'python', 'nodejs') or None
         """
-        # Use dedicated runtime detection service to keep this method clean
-        if not hasattr(self, '_runtime_detector'):
-            from .runtime_detection import RuntimeDetectionService
-            self._runtime_detector = RuntimeDetectionService()
-        
-        return self._runtime_detector.detect_runtime_type(component_dict)
+        properties = component_dict.get("properties") or {}
+        purl = properties.get("purl", "") or component_dict.get("purl", "")
+        return self._detect_runtime(component_dict.get("name", ""), component_dict.get("type", ""), purl)
+    
+    def _detect_runtime_uncached(self, name: str, component_type: str, purl: str) -> Optional[str]:
+        """Run the dedicated runtime detection service on the fields it inspects."""
+        return _get_runtime_detector().detect_runtime_type(
+            {"name": name, "type": component_type, "properties": {"purl": purl}}
+        )
     
     def categorize_component(self, component: Dict, detected_os: Optional[str] = None, os_knowledge_base=None) -> ComponentCategory:
         """
@@ -300,44 +652,62 @@ class ComponentFilter:
         Returns:
             ComponentCategory enum value
         """
-        component_type = component.get("type", "") or ""
-        component_name = component.get("name", "")
+        return self._classify_one(component.get("name"), component.get("type"), component.get("version"),
+                                component.get("properties"), detected_os, os_knowledge_base)
+    
+    def categorize_software_component(self, component: SoftwareComponent, detected_os: Optional[str] = None,
+                                      os_knowledge_base=None) -> ComponentCategory:
+        """
+        Categorize a SoftwareComponent without building a component dict.
+        
+        Args:
+            component: SoftwareComponent object
+            detected_os: Optional detected OS name
+            os_knowledge_base: Optional OS-specific knowledge base
+            
+        Returns:
+            ComponentCategory enum value
+        """
+        return self._classify_one(component.name, component.component_type, component.version,
+                                component.properties, detected_os, os_knowledge_base)
+    
+    def _classify_one(self, component_name: Optional[str], component_type: Optional[str], version: Optional[str],
+                      properties: Optional[Dict], detected_os: Optional[str] = None,
+                      os_knowledge_base=None) -> ComponentCategory:
+        """
+        Field-level implementation of categorize_component.
+        
+        Every check reads the fields passed in once; the knowledge base is consulted at most once
+        (is_system_package_by_os would repeat the lookup categorize has already made).
+        """
+        component_type = component_type or ""
+        component_name = component_name or ""
         
         # Kernel modules are always compatible if OS is compatible
-        if component_type.lower() in ["linux-kernel-module", "kernel-module"]:
-            if detected_os and self.is_graviton_compatible_os(detected_os):
-                return ComponentCategory.SYSTEM_COMPATIBLE
-            else:
-                return ComponentCategory.SYSTEM_UNKNOWN
+        if component_type.lower() in _KERNEL_MODULE_PACKAGE_TYPES:
+            return self._system_category(detected_os)
         
-        # Check if component exists in OS-specific knowledge base
-        if detected_os and os_knowledge_base and hasattr(os_knowledge_base, 'find_software'):
-            software_entry = os_knowledge_base.find_software(component_name)
-            if software_entry:
-                # Check if it's marked as OS native
-                metadata = software_entry.metadata or {}
-                if isinstance(metadata, dict) and metadata.get('os_native', False):
-                    if self.is_graviton_compatible_os(detected_os):
-                        return ComponentCategory.SYSTEM_COMPATIBLE
-                    else:
-                        return ComponentCategory.SYSTEM_UNKNOWN
-        
-        # Fallback to pattern-based detection
-        if detected_os:
-            is_system = self.is_system_package_by_os(component, detected_os, os_knowledge_base)
-            if is_system:
-                if self.is_graviton_compatible_os(detected_os):
-                    return ComponentCategory.SYSTEM_COMPATIBLE
-                else:
-                    return ComponentCategory.SYSTEM_UNKNOWN
-        else:
+        if not detected_os:
             # No OS detected, check general system package patterns
-            if self.is_system_package(component) or self.is_os_kernel_component(component):
+            if (self._is_system_package(component_name, component_type, properties) or
+                    self._is_os_kernel_component(component_name, component_type, properties)):
                 return ComponentCategory.SYSTEM_UNKNOWN
+            return ComponentCategory.APPLICATION
+        
+        # Check if component exists in OS-specific knowledge base, then fall back to pattern-based detection
+        if (self._is_os_native(component_name, os_knowledge_base) or
+                self._matches_os_package_rules(component_name, component_type, version, properties, detected_os)):
+            return self._system_category(detected_os)
         
         # Default to application package
         return ComponentCategory.APPLICATION
     
+    def _system_category(self, detected_os: Optional[str]) -> ComponentCategory:
+        """Categorize a system component by whether the detected OS is Graviton compatible."""
+        if detected_os and self.is_graviton_compatible_os(detected_os):
+            return ComponentCategory.SYSTEM_COMPATIBLE
+        return ComponentCategory.SYSTEM_UNKNOWN
+    
     def get_os_package_types(self, os_name: str) -> List[str]:
         """
         Get supported package types for specific OS.
@@ -394,6 +764,7 @@ class OSKernelDetector:
             "kernel-module",
             "driver"
         ]
+        self._kernel_module_types_lc = frozenset(t.lower() for t in self.kernel_module_types)
         
         # Apply custom patterns if provided
         if custom_patterns:
@@ -403,6 +774,38 @@ class OSKernelDetector:
                 self.system_library_patterns.extend(custom_patterns['system_library'])
             if 'os_utility' in custom_patterns:
                 self.os_utility_patterns.extend(custom_patterns['os_utility'])
+        
+        # Pattern lists backing each category's compiled alternation. System package names
+        # always come from the OS compatibility JSON, even when a config file supplies the rest
+        self._pattern_sources = {
+            'kernel': self.kernel_patterns,
+            'system_library': self.system_library_patterns,
+            'os_utility': self.os_utility_patterns,
+            'system_package_names': system_patterns.get("system_package_names", []),
+        }
+        # Compiled per category on first use; dropped again whenever patterns are added
+        self._matchers: Dict[str, CategoryMatcher] = {}
+        # SBOMs repeat names across versions; matching is case-insensitive, so results are
+        # cached per (category, lowercased name) and cleared whenever patterns change
+        self._match_name = functools.lru_cache(maxsize=4096)(self._match_name_uncached)
+    
+    def _matcher(self, pattern_type: str) -> CategoryMatcher:
+        """Return the compiled matchers for a pattern category, rebuilding them if stale."""
+        matcher = self._matchers.get(pattern_type)
+        if matcher is None:
+            matcher = self._matchers[pattern_type] = _compile_category(self._pattern_sources[pattern_type])
+        return matcher
+    
+    def _match_name_uncached(self, pattern_type: str, name_lower: str) -> bool:
+        """Match a lowercased component name against a pattern category."""
+        matcher = self._matcher(pattern_type)
+        return (
+            name_lower in matcher.exact or
+            name_lower.startswith(matcher.prefixes) or
+            name_lower.endswith(matcher.suffixes) or
+            matcher.union.match(name_lower) is not None or
+            any(pattern.match(name_lower) for pattern in matcher.fallback)
+        )
     
     def is_os_kernel_component(self, component_name: str, component_type: str, properties: Optional[Dict] = None) -> bool:
         """
@@ -435,13 +838,13 @@ class OSKernelDetector:
             True if component is a kernel module, False otherwise
         """
         # Check component type first
-        if component_type.lower() in [t.lower() for t in self.kernel_module_types]:
+        if component_type.lower() in self._kernel_module_types_lc:
             return True
         
         # Check properties for syft:package:type (CycloneDX SBOMs)
         if properties:
-            syft_package_type = properties.get("syft:package:type", "")
-            if syft_package_type.lower() in [t.lower() for t in self.kernel_module_types]:
+            syft_package_type = properties.get(_SYFT_PKG_TYPE) or ""
+            if syft_package_type.lower() in self._kernel_module_types_lc:
                 return True
         
         # Check name patterns
@@ -457,10 +860,7 @@ class OSKernelDetector:
         Returns:
             True if component name matches kernel module patterns
         """
-        for pattern in self.kernel_patterns:
-            if re.match(pattern, component_name, re.IGNORECASE):
-                return True
-        return False
+        return self._match_name('kernel', component_name.lower())
     
     def is_system_library(self, component_name: str) -> bool:
         """
@@ -472,11 +872,7 @@ class OSKernelDetector:
         Returns:
             True if component is a system library, False otherwise
         """
-        for pattern in self.system_library_patterns:
-            if re.match(pattern, component_name, re.IGNORECASE):
-                return True
-        
-        return False
+        return self._match_name('system_library', component_name.lower())
     
     def is_os_utility(self, component_name: str) -> bool:
         """
@@ -488,11 +884,19 @@ class OSKernelDetector:
         Returns:
             True if component is an OS utility, False otherwise
         """
-        for pattern in self.os_utility_patterns:
-            if re.match(pattern, component_name, re.IGNORECASE):
-                return True
+        return self._match_name('os_utility', component_name.lower())
+    
+    def is_system_package_name(self, component_name: str) -> bool:
+        """
+        Check if a component name matches the system package name patterns.
         
-        return False
+        Args:
+            component_name: Name of the component
+            
+        Returns:
+            True if component name matches system package name patterns
+        """
+        return self._match_name('system_package_names', component_name.lower())
     
     def add_custom_patterns(self, pattern_type: str, patterns: List[str]) -> None:
         """
@@ -510,6 +914,8 @@ class OSKernelDetector:
             self.os_utility_patterns.extend(patterns)
         else:
             raise ValueError(f"Unknown pattern type: {pattern_type}")
+        self._matchers.pop(pattern_type, None)
+        self._match_name.cache_clear()
     
     def load_patterns_from_config(self, config_file: str) -> None:
         """
@@ -521,9 +927,29 @@ class OSKernelDetector:
         config = FilterConfig(config_file)
         
         # Extend existing patterns with those from config
-        self.kernel_patterns.extend(config.get_patterns('kernel'))
-        self.system_library_patterns.extend(config.get_patterns('system_library'))
-        self.os_utility_patterns.extend(config.get_patterns('os_utility'))
+        for pattern_type in ('kernel', 'system_library', 'os_utility'):
+            self.add_custom_patterns(pattern_type, config.get_patterns(pattern_type))
+
+
+_default_filter: Optional[ComponentFilter] = None
+_default_filter_lock = threading.Lock()
+
+
+def _get_default_filter() -> ComponentFilter:
+    """Return the shared default ComponentFilter, constructing it on first use."""
+    global _default_filter
+    if _default_filter is None:
+        with _default_filter_lock:
+            if _default_filter is None:
+                _default_filter = ComponentFilter()
+    return _default_filter
+
+
+def reset_default_filter() -> None:
+    """Drop the shared default ComponentFilter so the next call rebuilds it (e.g. after config changes)."""
+    global _default_filter
+    with _default_filter_lock:
+        _default_filter = None
 
 
 def filter_system_packages(components: List[SoftwareComponent], detected_os: Optional[str] = None, os_knowledge_base=None) -> Tuple[List[SoftwareComponent], List[SoftwareComponent]]:
@@ -538,23 +964,16 @@ def filter_system_packages(components: List[SoftwareComponent], detected_os: Opt
     Returns:
         Tuple of (application_components, system_components)
     """
-    component_filter = ComponentFilter()
+    classify = _get_default_filter()._classify_one
+    system_categories = _SYSTEM_CATEGORIES
     application_components = []
     system_components = []
+    add_application = application_components.append
+    add_system = system_components.append
     
     for component in components:
-        component_dict = {
-            "name": component.name,
-            "version": component.version,
-            "type": component.component_type,
-            "properties": component.properties
-        }
-        
-        category = component_filter.categorize_component(component_dict, detected_os, os_knowledge_base)
-        
-        if category in [ComponentCategory.SYSTEM_COMPATIBLE, ComponentCategory.SYSTEM_UNKNOWN, ComponentCategory.KERNEL_MODULE]:
-            system_components.append(component)
-        else:
-            application_components.append(component)
+        category = classify(component.name, component.component_type, component.version,
+                            component.properties, detected_os, os_knowledge_base)
+        (add_system if category in system_categories else add_application)(component)
     
     return application_components, system_components
\ No newline at end of file
@@ -13,12 +13,17 @@ import defusedxml.ElementTree as ET
 import re
 import tempfile
 import argparse
+import functools
 import time
 import logging
+import platform
 import shutil
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 
 # Add parent directories to path for imports
@@ -58,6 +63,32 @@ def info(msg): logger.info(msg)
 def warn(msg): logger.warning(msg)
 def error(msg): logger.error(msg)
 
+# Host architecture, resolved in-process once at import (no uname/wmic subprocess per analyzer).
+# platform.machine() reports 'aarch64' on Linux and 'arm64'/'ARM64' on macOS and Windows on ARM.
+_MACHINE = platform.machine()
+_IS_ARM = _MACHINE.lower() in ('aarch64', 'arm64')
+
+# Separators between version components, e.g. 4.1.46.Final or 1.5.0-4
+_VERSION_SPLIT_RE = re.compile(r'[.\-]')
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_version(v: Optional[str]) -> Tuple[Union[int, str], ...]:
+    """Split a version string into int/str components for comparison (cached per distinct version)."""
+    # Handle None and strip whitespace
+    if not v:
+        return (0,)
+    v = str(v).strip().lower().replace('final', '').replace('release', '').strip()
+    parts = []
+    for x in _VERSION_SPLIT_RE.split(v):
+        x = x.strip()  # Strip whitespace from each part
+        if x:
+            if x.isdigit():
+                parts.append(int(x))
+            else:
+                parts.append(x)
+    return tuple(parts) if parts else (0,)
+
 # Known problematic libraries with ARM compatibility issues
 KNOWN_PROBLEMATIC_LIBRARIES = {
     'com.github.jnr:jnr-ffi': {'fixed_in': '2.2.0', 'issue': 'Native code compatibility issues', 'details': 'Uses native code for FFI that requires ARM-specific builds'},
@@ -74,6 +105,11 @@ KNOWN_PROBLEMATIC_LIBRARIES = {
     'org.bytedeco:javacpp': {'fixed_in': '1.5.5', 'issue': 'Native code compatibility issues', 'details': 'JavaCPP provides native C++ integration that requires ARM-specific builds'}
 }
 
+# The fixed_in versions are constants: normalize them once so only the dependency's version is parsed per check
+for _issue_info in KNOWN_PROBLEMATIC_LIBRARIES.values():
+    _issue_info['_fixed_in_parsed'] = _normalize_version(_issue_info['fixed_in'])
+del _issue_info
+
 NATIVE_CODE_LIBRARIES = [
     'org.lwjgl', 'com.github.jnr', 'net.java.dev.jna', 'org.xerial', 'io.netty',
     'org.rocksdb', 'org.bytedeco', 'org.apache.hadoop:hadoop-common', 'org.apache.hadoop:hadoop-hdfs',
@@ -87,6 +123,18 @@ NATIVE_CODE_LIBRARIES = [
     'native-lib-loader'
 ]
 
+# Entries match as plain string prefixes of "group:artifact" (io.netty also covers io.netty.incubator,
+# hadoop-common covers hadoop-common-*), so they are checked with one tuple startswith call
+_NATIVE_CODE_PREFIXES = tuple(NATIVE_CODE_LIBRARIES)
+
+def _has_arm_classifier(classifier: str) -> bool:
+    """Whether a Maven classifier already names an ARM architecture."""
+    return bool(classifier) and any(arm_arch in classifier.lower() for arm_arch in
+                                    ['arm64', 'aarch64', 'arm', 'aarch32'])
+
+# Class names that usually hold JNI declarations, scanned first when looking for native methods
+_JNI_CLASS_HINT_RE = re.compile(r'native|jni|loader', re.IGNORECASE)
+
 ARM_CLASSIFIER_LIBRARIES = {
     'io.netty:netty-transport-native-epoll': ['linux-aarch_64', 'linux-arm_64'],
     'org.lwjgl:lwjgl': ['natives-linux-arm64', 'natives-linux-arm32'],
@@ -104,6 +152,8 @@ class JavaCompatibilityAnalyzer:
         self.runtime_tester = None
         self.is_arm = self._detect_architecture()
         self.dependency_installer = None
+        # Maven Central ARM classifiers prefetched by prefetch_arm_classifiers, keyed by (groupId, artifactId, version)
+        self.arm_classifier_results = {}
     
     def cleanup(self):
         """Clean up all temporary resources."""
@@ -119,27 +169,13 @@ class JavaCompatibilityAnalyzer:
     
     def _detect_architecture(self) -> bool:
         """Detect if running on ARM architecture with cross-platform support."""
-        try:
-            # Try Linux/macOS first
-            arch = subprocess.run(['uname', '-m'], capture_output=True, text=True).stdout.strip()
-            is_arm = arch in ['aarch64', 'arm64']
-            debug(f"[ARCH_DETECT] Linux/macOS architecture: {arch}, is_arm: {is_arm}")
-            if not is_arm:
-                warn(f"Not running on ARM architecture ({arch}). Test results may not be accurate for ARM compatibility.")
-            return is_arm
-        except:
-            # Try Windows
-            try:
-                arch = subprocess.run(['wmic', 'os', 'get', 'OSArchitecture'], 
-                                    capture_output=True, text=True).stdout
-                is_arm = 'ARM' in arch.upper()
-                debug(f"[ARCH_DETECT] Windows architecture: {arch.strip()}, is_arm: {is_arm}")
-                if not is_arm:
-                    warn(f"Not running on ARM architecture. Test results may not be accurate for ARM compatibility.")
-                return is_arm
-            except:
-                warn("Could not determine system architecture. Assuming x86.")
-                return False
+        if not _MACHINE:
+            warn("Could not determine system architecture. Assuming x86.")
+            return False
+        debug(f"[ARCH_DETECT] Host architecture: {_MACHINE}, is_arm: {_IS_ARM}")
+        if not _IS_ARM:
+            warn(f"Not running on ARM architecture ({_MACHINE}). Test results may not be accurate for ARM compatibility.")
+        return _IS_ARM
     
     def analyze_dependency(self, dep: Dict[str, Any], deep_scan: bool = False, 
                           runtime_test: bool = False) -> ComponentResult:
@@ -205,6 +241,15 @@ class JavaCompatibilityAnalyzer:
         debug(f"[ANALYZE_COMPLETE] Final result for {dep_key}: status={compatibility.status.value}, notes='{compatibility.notes[:100]}...'")
         return ComponentResult(component=component, compatibility=compatibility, matched_name=None)
     
+    def prefetch_arm_classifiers(self, deps: List[Dict[str, Any]]):
+        """Query Maven Central for every dependency that will need it, in parallel."""
+        pending = [dep for dep in deps
+                   if not _has_arm_classifier(dep.get('classifier', ''))
+                   and MavenCentralChecker.lookup_key(dep) not in self.arm_classifier_results]
+        if pending:
+            debug(f"[MAVEN_CENTRAL_PREFETCH] Prefetching ARM classifiers for {len(pending)} dependencies")
+            self.arm_classifier_results.update(MavenCentralChecker.check_arm_classifiers_bulk(pending))
+    
     def _check_basic_compatibility(self, dep: Dict[str, Any], 
                                  component: SoftwareComponent, 
                                  compatibility: CompatibilityResult):
@@ -220,8 +265,7 @@ class JavaCompatibilityAnalyzer:
         
         # Check ARM-specific classifier
         debug(f"[BASIC_CHECK_CLASSIFIER] Checking classifier '{classifier}' for ARM indicators")
-        if classifier and any(arm_arch in classifier.lower() for arm_arch in 
-                             ['arm64', 'aarch64', 'arm', 'aarch32']):
+        if _has_arm_classifier(classifier):
             debug(f"[BASIC_CHECK_CLASSIFIER_MATCH] ARM-specific classifier detected: '{classifier}'")
             compatibility.status = CompatibilityStatus.COMPATIBLE
             compatibility.current_version_supported = True
@@ -234,7 +278,10 @@ class JavaCompatibilityAnalyzer:
         
         # Check Maven Central for ARM classifiers
         debug(f"[BASIC_CHECK_MAVEN_CENTRAL] Checking Maven Central for ARM classifiers for {dep_key}")
-        arm_classifiers = MavenCentralChecker.check_arm_classifiers(dep)
+        lookup_key = MavenCentralChecker.lookup_key(dep)
+        arm_classifiers = self.arm_classifier_results.get(lookup_key)
+        if arm_classifiers is None:
+            arm_classifiers = MavenCentralChecker.check_arm_classifiers(dep)
         if arm_classifiers:
             debug(f"[BASIC_CHECK_MAVEN_CENTRAL_FOUND] Found ARM classifiers: {arm_classifiers}")
             component.properties['available_arm_classifiers'] = ','.join(arm_classifiers)
@@ -246,7 +293,7 @@ class JavaCompatibilityAnalyzer:
         if dep_key in KNOWN_PROBLEMATIC_LIBRARIES:
             issue_info = KNOWN_PROBLEMATIC_LIBRARIES[dep_key]
             debug(f"[BASIC_CHECK_KNOWN_ISSUES_FOUND] Found in problematic list - issue: '{issue_info['issue']}', fixed_in: '{issue_info['fixed_in']}'")
-            version_comparison = self._compare_versions(version, issue_info['fixed_in'])
+            version_comparison = self._compare_parsed(_normalize_version(version), issue_info['_fixed_in_parsed'])
             debug(f"[BASIC_CHECK_VERSION_COMPARE] Comparing current version '{version}' with fixed version '{issue_info['fixed_in']}': result={version_comparison}")
             
             if version_comparison < 0:
@@ -267,16 +314,14 @@ class JavaCompatibilityAnalyzer:
         # Check native code libraries
         debug(f"[BASIC_CHECK_NATIVE] Checking if {dep_key} matches any native code library patterns")
         native_lib_match = None
-        for native_lib in NATIVE_CODE_LIBRARIES:
-            if dep_key.startswith(native_lib):
-                native_lib_match = native_lib
-                debug(f"[BASIC_CHECK_NATIVE_MATCH] Matched native library pattern: '{native_lib}'")
-                component.properties['native_build_detected'] = 'Yes'
-                if compatibility.status == CompatibilityStatus.UNKNOWN:
-                    compatibility.status = CompatibilityStatus.NEEDS_VERIFICATION
-                    compatibility.notes = "Native code requires ARM64 verification"
-                    debug(f"[BASIC_CHECK_NATIVE_RESULT] Marked as NEEDS_VERIFICATION due to native code")
-                break
+        if dep_key.startswith(_NATIVE_CODE_PREFIXES):
+            native_lib_match = next(native_lib for native_lib in NATIVE_CODE_LIBRARIES if dep_key.startswith(native_lib))
+            debug(f"[BASIC_CHECK_NATIVE_MATCH] Matched native library pattern: '{native_lib_match}'")
+            component.properties['native_build_detected'] = 'Yes'
+            if compatibility.status == CompatibilityStatus.UNKNOWN:
+                compatibility.status = CompatibilityStatus.NEEDS_VERIFICATION
+                compatibility.notes = "Native code requires ARM64 verification"
+                debug(f"[BASIC_CHECK_NATIVE_RESULT] Marked as NEEDS_VERIFICATION due to native code")
         
         if not native_lib_match:
             debug(f"[BASIC_CHECK_NATIVE_NO_MATCH] No native code library patterns matched")
@@ -381,8 +426,12 @@ class JavaCompatibilityAnalyzer:
             f"~/.m2/repository/{dep['groupId'].replace('.', '/')}/{dep['artifactId']}/{dep['version']}/{dep['artifactId']}-{dep['version']}.jar"
         )
     
-    def _check_jar_native_code(self, jar_path: str) -> Dict[str, Any]:
-        """Enhanced JAR analysis for native code, platform directories, JNI methods, and native library loaders."""
+    def _check_jar_native_code(self, jar_path: str, deep_scan: bool = True) -> Dict[str, Any]:
+        """Enhanced JAR analysis for native code, platform directories, JNI methods, and native library loaders.
+        
+        Everything except the JNI hint comes from entry names in the central directory. Class files are
+        only decompressed when deep_scan is set and the names alone leave the architecture undecided.
+        """
         debug(f"[JAR_NATIVE_CHECK_START] Checking JAR for native code: {jar_path}")
         native_info = {
             'has_native_code': False,
@@ -400,13 +449,15 @@ class JavaCompatibilityAnalyzer:
         try:
             debug(f"[JAR_NATIVE_CHECK_OPEN] Opening JAR file for analysis")
             with zipfile.ZipFile(jar_path, 'r') as jar:
-                jar_contents = jar.namelist()
+                jar_contents = jar.infolist()
                 debug(f"[JAR_NATIVE_CHECK_CONTENTS] JAR contains {len(jar_contents)} entries")
                 
                 native_files_found = []
                 platform_dirs_found = set()
+                class_entries = []
                 
-                for entry in jar_contents:
+                for info in jar_contents:
+                    entry = info.filename
                     entry_lower = entry.lower()
                     
                     # Check for native libraries
@@ -459,14 +510,21 @@ class JavaCompatibilityAnalyzer:
                         native_info['native_lib_loaders'] = True
                         native_info['has_native_code'] = True
                     
-                    # Check for JNI-related files
+                    # Collect JNI candidates; their bytes are only read if the verdict depends on them
                     if '.class' in entry_lower:
+                        class_entries.append(info)
+                
+                # The JNI hint only matters when native code was found without a single clear architecture
+                if deep_scan and native_info['has_native_code'] and native_info['arm_specific'] == native_info['x86_specific']:
+                    # Likely JNI wrappers first so the scan usually stops after a handful of reads
+                    class_entries.sort(key=lambda info: not _JNI_CLASS_HINT_RE.search(info.filename))
+                    for info in class_entries:
                         try:
                             # Read class file and check for JNI methods (simplified check)
-                            class_data = jar.read(entry)
-                            if b'native' in class_data:
+                            if b'native' in jar.read(info):
                                 native_info['has_jni'] = True
-                                debug(f"[JAR_NATIVE_CHECK_JNI] Potential JNI methods found in: {entry}")
+                                debug(f"[JAR_NATIVE_CHECK_JNI] Potential JNI methods found in: {info.filename}")
+                                break
                         except:
                             pass
                 
@@ -479,25 +537,9 @@ class JavaCompatibilityAnalyzer:
         
         return native_info
     
-    def _compare_versions(self, version1: str, version2: str) -> int:
-        """Compare version strings. Returns -1, 0, or 1."""
-        def normalize(v):
-            # Handle None and strip whitespace
-            if not v:
-                return [0]
-            v = str(v).strip().lower().replace('final', '').replace('release', '').strip()
-            parts = []
-            for x in re.split(r'[.\-]', v):
-                x = x.strip()  # Strip whitespace from each part
-                if x:
-                    if x.isdigit():
-                        parts.append(int(x))
-                    else:
-                        parts.append(x)
-            return parts if parts else [0]
-        
-        parts1, parts2 = normalize(version1), normalize(version2)
-        
+    @staticmethod
+    def _compare_parsed(parts1: Tuple[Union[int, str], ...], parts2: Tuple[Union[int, str], ...]) -> int:
+        """Compare versions already split by _normalize_version. Returns -1, 0, or 1."""
         for i in range(max(len(parts1), len(parts2))):
             v1 = parts1[i] if i < len(parts1) else 0
             v2 = parts2[i] if i < len(parts2) else 0
@@ -514,17 +556,150 @@ class JavaCompatibilityAnalyzer:
 class MavenCentralChecker:
     """Check Maven Central for ARM-specific classifiers and dependency information."""
     
+    MAX_CONCURRENT_LOOKUPS = 16
+    
+    # Classifier lists survive across runs in $XDG_CACHE_HOME (default ~/.cache); entries older
+    # than the TTL are queried again. Set CACHE_FILE to override the location.
+    CACHE_FILE = None
+    CACHE_TTL_SECONDS = 24 * 60 * 60
+    _cache = None
+    _cache_lock = threading.Lock()
+    
+    @staticmethod
+    def lookup_key(dep: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Key identifying the Maven Central query made for a dependency."""
+        return (dep.get('groupId', ''), dep.get('artifactId', ''), dep.get('version', 'unknown'))
+    
+    @classmethod
+    def _cache_file(cls) -> Optional[Path]:
+        """Resolve the cache file location, or None when no cache directory can be determined."""
+        if cls.CACHE_FILE is not None:
+            return Path(cls.CACHE_FILE)
+        try:
+            cache_home = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+        except (KeyError, RuntimeError) as e:
+            # No resolvable home directory, e.g. an arbitrary UID in a container
+            debug(f"[MAVEN_CENTRAL_CACHE] No cache directory available, caching in memory only: {e}")
+            return None
+        return Path(cache_home) / 'graviton_validator' / 'maven_central.json'
+    
+    @classmethod
+    def _load_cache(cls) -> Dict[str, Dict[str, Any]]:
+        """Load unexpired cache entries from disk once per process. Caller holds _cache_lock."""
+        if cls._cache is None:
+            cls._cache = {}
+            cache_file = cls._cache_file()
+            if cache_file is None:
+                return cls._cache
+            try:
+                with open(cache_file, 'r') as f:
+                    entries = json.load(f)
+                cutoff = time.time() - cls.CACHE_TTL_SECONDS
+                cls._cache = {key: entry for key, entry in entries.items() if entry.get('timestamp', 0) > cutoff}
+                debug(f"[MAVEN_CENTRAL_CACHE] Loaded {len(cls._cache)} cached lookups from {cache_file}")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                debug(f"[MAVEN_CENTRAL_CACHE] Ignoring unreadable cache {cache_file}: {e}")
+        return cls._cache
+    
+    @classmethod
+    def _get_cached(cls, cache_key: str) -> Optional[List[str]]:
+        """Return cached classifiers for a group:artifact:version key, or None if absent or expired."""
+        with cls._cache_lock:
+            entry = cls._load_cache().get(cache_key)
+        if entry and time.time() - entry['timestamp'] < cls.CACHE_TTL_SECONDS:
+            debug(f"[MAVEN_CENTRAL_CACHE] Cache hit for {cache_key}")
+            return entry['classifiers']
+        return None
+    
+    @classmethod
+    def _store_cached(cls, results: Dict[str, List[str]]):
+        """Record fresh lookups and rewrite the cache file in one go."""
+        if not results:
+            return
+        now = time.time()
+        with cls._cache_lock:
+            cache = cls._load_cache()
+            for cache_key, classifiers in results.items():
+                cache[cache_key] = {'classifiers': classifiers, 'timestamp': now}
+            cache_file = cls._cache_file()
+            if cache_file is None:
+                return
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+                with open(tmp_file, 'w') as f:
+                    json.dump(cache, f)
+                os.replace(tmp_file, cache_file)
+            except Exception as e:
+                debug(f"[MAVEN_CENTRAL_CACHE] Failed to write cache {cache_file}: {e}")
+    
     @staticmethod
-    def check_arm_classifiers(dep: Dict[str, Any]) -> List[str]:
+    def check_arm_classifiers_bulk(deps: List[Dict[str, Any]]) -> Dict[Tuple[str, str, str], List[str]]:
+        """Check Maven Central for many dependencies concurrently over one keep-alive session."""
+        results = {}
+        to_fetch = {}
+        for dep in deps:
+            key = MavenCentralChecker.lookup_key(dep)
+            if key in results or key in to_fetch:
+                continue
+            if not MavenCentralChecker._is_queryable(key):
+                results[key] = []
+                continue
+            cached = MavenCentralChecker._get_cached(':'.join(map(str, key)))
+            if cached is not None:
+                results[key] = cached
+            else:
+                to_fetch[key] = dep
+        if not to_fetch:
+            return results
+        
+        debug(f"[MAVEN_CENTRAL] {len(results)} lookups served from cache, fetching {len(to_fetch)}")
+        workers = min(MavenCentralChecker.MAX_CONCURRENT_LOOKUPS, len(to_fetch))
+        with requests.Session() as session:
+            adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+            session.mount('https://', adapter)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fetched = dict(zip(to_fetch.keys(), executor.map(
+                    lambda dep: MavenCentralChecker._fetch_arm_classifiers(dep, session), to_fetch.values())))
+        
+        MavenCentralChecker._store_cached({':'.join(map(str, key)): classifiers
+                                           for key, classifiers in fetched.items() if classifiers is not None})
+        for key, classifiers in fetched.items():
+            results[key] = classifiers or []
+        return results
+    
+    @staticmethod
+    def check_arm_classifiers(dep: Dict[str, Any], session: Optional[requests.Session] = None) -> List[str]:
         """Check Maven Central for ARM-specific classifiers."""
+        key = MavenCentralChecker.lookup_key(dep)
+        if not MavenCentralChecker._is_queryable(key):
+            return []
+        
+        cache_key = ':'.join(map(str, key))
+        cached = MavenCentralChecker._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
+        arm_classifiers = MavenCentralChecker._fetch_arm_classifiers(dep, session)
+        if arm_classifiers is None:
+            return []
+        MavenCentralChecker._store_cached({cache_key: arm_classifiers})
+        return arm_classifiers
+    
+    @staticmethod
+    def _is_queryable(key: Tuple[str, str, str]) -> bool:
+        """Maven Central can only be searched with a full group, artifact and version."""
+        group_id, artifact_id, version = key
+        return bool(group_id and artifact_id) and version != 'unknown'
+    
+    @staticmethod
+    def _fetch_arm_classifiers(dep: Dict[str, Any], session: Optional[requests.Session] = None) -> Optional[List[str]]:
+        """Query Maven Central directly. Returns None on failure so errors are never cached."""
         arm_classifiers = []
         try:
-            group_id = dep.get('groupId', '')
-            artifact_id = dep.get('artifactId', '')
-            version = dep.get('version', 'unknown')
-            
-            if not group_id or not artifact_id or version == 'unknown':
-                return arm_classifiers
+            group_id, artifact_id, version = MavenCentralChecker.lookup_key(dep)
             
             # Maven Central REST API URL
             base_url = "https://search.maven.org/solrsearch/select"
@@ -532,7 +707,7 @@ class MavenCentralChecker:
             params = {'q': query, 'rows': 100, 'wt': 'json'}
             
             debug(f"[MAVEN_CENTRAL] Checking for ARM classifiers: {group_id}:{artifact_id}:{version}")
-            response = requests.get(base_url, params=params, timeout=10)
+            response = (session or requests).get(base_url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -546,7 +721,7 @@ class MavenCentralChecker:
             return arm_classifiers
         except Exception as e:
             debug(f"[MAVEN_CENTRAL] Error checking for ARM classifiers: {str(e)}")
-            return []
+            return None
 
 class DependencyInstaller:
     """Test individual dependency installation via Maven."""
@@ -680,18 +855,7 @@ class JavaRuntimeTester:
     
     def _detect_architecture(self) -> bool:
         """Detect if running on ARM architecture with cross-platform support."""
-        try:
-            # Try Linux/macOS first
-            arch = subprocess.run(['uname', '-m'], capture_output=True, text=True).stdout.strip()
-            return arch in ['aarch64', 'arm64']
-        except:
-            # Try Windows
-            try:
-                arch = subprocess.run(['wmic', 'os', 'get', 'OSArchitecture'], 
-                                    capture_output=True, text=True).stdout
-                return 'ARM' in arch.upper()
-            except:
-                return False
+        return _IS_ARM
     
     def test_dependency(self, dep: Dict[str, Any], component: SoftwareComponent) -> bool:
         """Test dependency runtime compatibility."""
@@ -1067,6 +1231,7 @@ def analyze_pom_file(pom_path: str, deep_scan: bool = False, runtime_test: bool
     results = []
     
     try:
+        analyzer.prefetch_arm_classifiers(dependencies)
         for i, (group_key, group_deps) in enumerate(dependency_groups.items(), 1):
             debug(f"[POM_ANALYZE_GROUP] Analyzing group {i}/{len(dependency_groups)}: {group_key} ({len(group_deps)} versions)")
             group_results = analyze_dependency_versions(group_key, group_deps, analyzer, 
@@ -1327,7 +1492,7 @@ def analyze_jar_directory(jar_dir: str, runtime_test: bool = False) -> List[Comp
             
             # Perform JAR analysis
             debug(f"[JAR_DIR_ANALYSIS_NATIVE] Starting native code analysis for: {jar_name}")
-            native_info = analyzer._check_jar_native_code(jar_file)
+            native_info = analyzer._check_jar_native_code(jar_file, deep_scan=False)
             debug(f"[JAR_DIR_ANALYSIS_NATIVE_RESULT] Native analysis result: {native_info}")
             
             # Set compatibility based on analysis
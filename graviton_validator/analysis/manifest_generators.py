@@ -146,7 +146,8 @@ class RuntimeAnalyzer(ABC):
         
         logger.info(f"Starting {runtime_type} dependency analysis")
         logger.debug(f"Manifest path: {manifest_path}")
-        logger.debug(f"Analysis kwargs: {list(kwargs.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Analysis kwargs: {list(kwargs)}")
         
         try:
             execution_env = kwargs.get('execution_env')
@@ -176,7 +177,7 @@ class RuntimeAnalyzer(ABC):
             else:
                 # Fallback: parse from stdout if file-based approach fails
                 try:
-                    package_results = json.loads(result.get('output', '[]'))
+                    package_results = json.loads(result.get('output') or '[]')
                     logger.info(f"Fallback: parsed {len(package_results)} {runtime_type} package results from stdout")
                     results = self.validator.validate_batch(package_results) if package_results else []
                     if results:
@@ -444,7 +445,7 @@ class NodeJSRuntimeAnalyzer(RuntimeAnalyzer):
         """Parse package.json for fallback results."""
         results = []
         try:
-            output = result.get('output', '')
+            output = result.get('output') or ''
             native_build = 'Yes' if any(indicator in output.lower() for indicator in ['gyp', 'node-gyp', 'binding.gyp', 'compile']) else 'No'
             
             with open(manifest_path, 'r') as f:
@@ -546,7 +547,7 @@ class RubyRuntimeAnalyzer(RuntimeAnalyzer):
 class RuntimeAnalyzerManager:
     """Manager for runtime-specific analyzers."""
     
-    def __init__(self, config_file: Optional[str] = None, use_containers: bool = None):
+    def __init__(self, config_file: Optional[str] = None, use_containers: bool = None, keep_images: bool = False):
         from .runtime_config import RuntimeConfig
         from .execution_environment import ExecutionEnvironmentFactory
         
@@ -559,7 +560,7 @@ class RuntimeAnalyzerManager:
             use_containers = os.environ.get('CODEBUILD_BUILD_ID') is None
             logger.info(f"Auto-detected execution mode: {'container' if use_containers else 'native'}")
         
-        self.execution_env = ExecutionEnvironmentFactory.create_environment(use_containers)
+        self.execution_env = ExecutionEnvironmentFactory.create_environment(use_containers, persist_images=keep_images)
         self.analyzers = [
             JavaRuntimeAnalyzer(),    # Java first
             PythonRuntimeAnalyzer(),  # Python second
@@ -637,7 +638,8 @@ class RuntimeAnalyzerManager:
         logger.info(f"Starting runtime analysis for {len(components)} components")
         logger.debug(f"Output directory: {output_dir}")
         logger.debug(f"SBOM data provided: {sbom_data is not None}")
-        logger.debug(f"Additional kwargs: {list(kwargs.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Additional kwargs: {list(kwargs)}")
         
         results = {}
         applicable_analyzers = self.get_applicable_analyzers(components)
@@ -754,7 +756,8 @@ class RuntimeAnalyzerManager:
                         'output_dir': output_dir,  # Pass output_dir to execution environment
                         'sbom_name': sbom_name  # Pass SBOM name for correct output filename
                     }
-                    logger.debug(f"Starting {runtime_type} dependency analysis with kwargs: {list(analysis_kwargs.keys())}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Starting {runtime_type} dependency analysis with kwargs: {list(analysis_kwargs)}")
                     logger.info(f"Executing {runtime_type} analysis on manifest: {manifest_path}")
                     
                     analysis_result = analyzer.analyze_dependencies(manifest_path, **analysis_kwargs)
@@ -11,6 +11,9 @@ from .filters import ComponentFilter
 class SBOMFilterStrategy(ABC):
     """Abstract base class for SBOM format-specific filtering strategies."""
     
+    # Exclusion rules ComponentFilter applies for this strategy's components
+    sbom_source = "other"
+    
     def __init__(self):
         self.component_filter = ComponentFilter(sbom_format=self.get_format_name())
     
@@ -26,48 +29,39 @@ class SBOMFilterStrategy(ABC):
     
     def filter_components(self, components: List[SoftwareComponent]) -> List[SoftwareComponent]:
         """Filter components based on format-specific logic."""
-        return [c for c in components if not self.should_exclude_component(c)]
+        # Same rules as should_exclude_component, with the per-source check selected once per pass
+        return self.component_filter.filter_components(components, self.sbom_source)
 
 
 class CycloneDXAppIdentifierFilter(SBOMFilterStrategy):
     """Filter for CycloneDX SBOMs generated by app_identifier.sh"""
     
+    sbom_source = "app_identifier"
+    
     def get_format_name(self) -> str:
         return "CycloneDX"
     
     def should_exclude_component(self, component: SoftwareComponent) -> bool:
         """Exclude both system packages and OS/kernel components."""
-        component_dict = {
-            "name": component.name,
-            "version": component.version,
-            "type": component.component_type,
-            "properties": component.properties
-        }
-        
-        return (self.component_filter.is_system_package(component_dict) or 
-                self.component_filter.is_os_kernel_component(component_dict))
+        return (self.component_filter.is_system_package_component(component) or 
+                self.component_filter.is_os_kernel_software_component(component))
 
 
 class CycloneDXThirdPartyFilter(SBOMFilterStrategy):
     """Filter for CycloneDX SBOMs from third-party tools like Syft."""
     
+    sbom_source = "third_party"
+    
     def get_format_name(self) -> str:
         return "CycloneDX"
     
     def should_exclude_component(self, component: SoftwareComponent) -> bool:
         """Keep system packages, exclude only OS/kernel components."""
-        component_dict = {
-            "name": component.name,
-            "version": component.version,
-            "type": component.component_type,
-            "properties": component.properties
-        }
-        
         # Keep system packages, exclude only OS/kernel components
-        if self.component_filter.is_system_package(component_dict):
+        if self.component_filter.is_system_package_component(component):
             return False  # Keep system packages
         
-        return self.component_filter.is_os_kernel_component(component_dict)
+        return self.component_filter.is_os_kernel_software_component(component)
 
 
 class SPDXFilter(SBOMFilterStrategy):
@@ -78,14 +72,7 @@ class SPDXFilter(SBOMFilterStrategy):
     
     def should_exclude_component(self, component: SoftwareComponent) -> bool:
         """Exclude only OS/kernel components."""
-        component_dict = {
-            "name": component.name,
-            "version": component.version,
-            "type": component.component_type,
-            "properties": component.properties
-        }
-        
-        return self.component_filter.is_os_kernel_component(component_dict)
+        return self.component_filter.is_os_kernel_software_component(component)
 
 
 class SyftFilter(SBOMFilterStrategy):
@@ -96,14 +83,7 @@ class SyftFilter(SBOMFilterStrategy):
     
     def should_exclude_component(self, component: SoftwareComponent) -> bool:
         """Exclude only OS/kernel components."""
-        component_dict = {
-            "name": component.name,
-            "version": component.version,
-            "type": component.component_type,
-            "properties": component.properties
-        }
-        
-        return self.component_filter.is_os_kernel_component(component_dict)
+        return self.component_filter.is_os_kernel_software_component(component)
 
 
 def get_filter_strategy(sbom_format: str, sbom_source: str) -> SBOMFilterStrategy:
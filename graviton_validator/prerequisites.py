@@ -3,7 +3,7 @@
 Prerequisites checker for graviton-validator flags.
 """
 
-import subprocess
+import shutil
 import sys
 from typing import List, Dict, Tuple
 import logging
@@ -94,13 +94,8 @@ class PrerequisiteChecker:
         return None
     
     def _check_tool(self, tool: str) -> bool:
-        """Check if a tool is available."""
-        try:
-            subprocess.run([tool, '--version'], 
-                         capture_output=True, check=True, timeout=10)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        """Check if a tool is available on PATH (no subprocess spawned)."""
+        return shutil.which(tool) is not None
     
     def get_container_tool(self) -> str:
         """Get the available container tool."""
@@ -38,6 +38,14 @@ RUNTIME_EXECUTION_CONFIGS = {
     'java': {'timeout': 300, 'default_version': '17', 'env_var': 'DEBUG', 'success_codes': [0, 2]}
 }
 
+# Exit codes treated as success when a runtime does not list its own
+DEFAULT_SUCCESS_CODES = frozenset({0})
+
+# Normalize success codes once at load so every execution mode shares the same O(1) membership test
+for _exec_config in RUNTIME_EXECUTION_CONFIGS.values():
+    _exec_config['success_codes'] = frozenset(_exec_config.get('success_codes', DEFAULT_SUCCESS_CODES))
+del _exec_config
+
 # Container image configurations - extracted from existing _generate_dockerfile logic
 CONTAINER_RUNTIME_CONFIGS = {
     'python': {